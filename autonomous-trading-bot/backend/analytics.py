@@ -0,0 +1,184 @@
+import math
+from collections import deque
+from typing import Dict, Optional
+
+
+class RollingReturns:
+    """Fixed-window return statistics maintained with running sums."""
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self.returns = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.downside_sq = 0.0
+
+    def __len__(self) -> int:
+        return len(self.returns)
+
+    def push(self, value: float) -> None:
+        """Add a return, dropping the oldest once the window is full."""
+        self.returns.append(value)
+        self.total += value
+        self.total_sq += value * value
+        self.downside_sq += min(value, 0.0) ** 2
+        if len(self.returns) > self.window:
+            old = self.returns.popleft()
+            self.total -= old
+            self.total_sq -= old * old
+            self.downside_sq -= min(old, 0.0) ** 2
+
+    def sharpe(self, scale: float = 1.0) -> Optional[float]:
+        """Mean over standard deviation of the windowed returns."""
+        n = len(self.returns)
+        if n < 2:
+            return None
+        mean = self.total / n
+        variance = max(self.total_sq / n - mean * mean, 0.0) * n / (n - 1)
+        if variance <= 1e-24:
+            return None
+        return mean / math.sqrt(variance) * scale
+
+    def sortino(self, scale: float = 1.0) -> Optional[float]:
+        """Mean over downside deviation of the windowed returns."""
+        n = len(self.returns)
+        if n < 2:
+            return None
+        downside = max(self.downside_sq, 0.0) / n
+        if downside <= 1e-24:
+            return None
+        return (self.total / n) / math.sqrt(downside) * scale
+
+
+class PortfolioAnalytics:
+    """Incremental PnL, fee, exposure, drawdown and risk-ratio tracking.
+
+    Every fill and tick updates the figures in O(1) without rescanning
+    history. The engine is exchange-agnostic, so live trading, paper trading
+    and simulated runs all report numbers from the same code.
+    """
+
+    def __init__(self, initial_equity: float = 0.0, window: int = 500,
+                 periods_per_year: Optional[float] = None):
+        self.window = window
+        # Annualise ratios when the sampling frequency is known
+        self.scale = math.sqrt(periods_per_year) if periods_per_year else 1.0
+        self.reset(initial_equity)
+
+    def reset(self, initial_equity: float) -> None:
+        """Clear all state and start again from ``initial_equity``."""
+        self.initial_equity = float(initial_equity)
+        self.positions: Dict[str, Dict[str, float]] = {}
+        self.realized_pnl = 0.0
+        self.unrealized_pnl = 0.0
+        self.fees = 0.0
+        self.exposure = 0.0
+        self.fills = 0
+        self.closed_trades = 0
+        self.winning_trades = 0
+        self.equity = self.initial_equity
+        self.peak_equity = self.initial_equity
+        self.max_drawdown = 0.0
+        self.returns = RollingReturns(self.window)
+
+    def _position(self, symbol: str) -> Dict[str, float]:
+        position = self.positions.get(symbol)
+        if position is None:
+            position = {'quantity': 0.0, 'avg_price': 0.0, 'last_price': 0.0,
+                        'unrealized_pnl': 0.0, 'exposure': 0.0}
+            self.positions[symbol] = position
+        return position
+
+    def _revalue(self, position: Dict[str, float], price: float) -> None:
+        """Re-mark one position, adjusting the portfolio totals by the difference."""
+        unrealized = (price - position['avg_price']) * position['quantity']
+        exposure = abs(position['quantity']) * price
+        self.unrealized_pnl += unrealized - position['unrealized_pnl']
+        self.exposure += exposure - position['exposure']
+        position['unrealized_pnl'] = unrealized
+        position['exposure'] = exposure
+        position['last_price'] = price
+
+    def _mark(self) -> None:
+        """Update equity, drawdown and the return series."""
+        previous = self.equity
+        self.equity = (self.initial_equity + self.realized_pnl
+                       + self.unrealized_pnl - self.fees)
+        if previous > 0:
+            self.returns.push(self.equity / previous - 1.0)
+        if self.equity > self.peak_equity:
+            self.peak_equity = self.equity
+        elif self.peak_equity > 0:
+            drawdown = (self.peak_equity - self.equity) / self.peak_equity
+            if drawdown > self.max_drawdown:
+                self.max_drawdown = drawdown
+
+    def on_fill(self, symbol: str, side: str, quantity: float, price: float,
+                fee: float = 0.0) -> float:
+        """Apply a fill and return the PnL it realized."""
+        position = self._position(symbol)
+        signed = quantity if side.lower() == 'buy' else -quantity
+        held = position['quantity']
+        realized = 0.0
+
+        if held and (held > 0) != (signed > 0):
+            # Reducing or flipping: realize PnL on the closed part
+            closed = min(abs(signed), abs(held))
+            realized = closed * (price - position['avg_price']) * (1 if held > 0 else -1)
+            self.realized_pnl += realized
+            self.closed_trades += 1
+            if realized > 0:
+                self.winning_trades += 1
+
+        new_quantity = held + signed
+        if abs(new_quantity) < 1e-12:
+            new_quantity = 0.0
+            position['avg_price'] = 0.0
+        elif held == 0 or (held > 0) != (new_quantity > 0):
+            # Opened fresh or flipped through zero
+            position['avg_price'] = price
+        elif abs(new_quantity) > abs(held):
+            position['avg_price'] = (held * position['avg_price'] + signed * price) / new_quantity
+        position['quantity'] = new_quantity
+
+        self.fees += fee
+        self.fills += 1
+        self._revalue(position, price)
+        self._mark()
+        return realized
+
+    def on_tick(self, symbol: str, price: float) -> None:
+        """Mark ``symbol`` to ``price``."""
+        position = self.positions.get(symbol)
+        if position is not None:
+            self._revalue(position, price)
+        self._mark()
+
+    @property
+    def total_pnl(self) -> float:
+        return self.realized_pnl + self.unrealized_pnl - self.fees
+
+    @property
+    def win_rate(self) -> Optional[float]:
+        if not self.closed_trades:
+            return None
+        return self.winning_trades / self.closed_trades
+
+    def snapshot(self) -> Dict:
+        """Current figures, rounded for display."""
+        sharpe = self.returns.sharpe(self.scale)
+        sortino = self.returns.sortino(self.scale)
+        return {
+            'equity': round(self.equity, 2),
+            'realized_pnl': round(self.realized_pnl, 2),
+            'unrealized_pnl': round(self.unrealized_pnl, 2),
+            'total_pnl': round(self.total_pnl, 2),
+            'fees': round(self.fees, 2),
+            'exposure': round(self.exposure, 2),
+            'max_drawdown': round(self.max_drawdown * 100, 2),
+            'sharpe': round(sharpe, 3) if sharpe is not None else None,
+            'sortino': round(sortino, 3) if sortino is not None else None,
+            'win_rate': round(self.win_rate * 100, 2) if self.win_rate is not None else None,
+            'fills': self.fills,
+            'closed_trades': self.closed_trades
+        }
@@ -0,0 +1,267 @@
+import csv
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .clock import get_clock
+from .logger import logger
+
+SIDES = {'buy': 1, 'sell': -1}
+STATUSES = ('new', 'open', 'partially_filled', 'filled', 'cancelled', 'rejected')
+FIELDS = ('seq', 'timestamp', 'exchange_time', 'order_id', 'symbol', 'side', 'quantity', 'price', 'status')
+
+
+class TradeBlotter:
+    """Append-only record of orders and fills held in a fixed-capacity ring buffer.
+
+    Each field lives in its own preallocated array, so memory stays constant
+    however long the bot runs. Rows pushed out of the buffer are appended to
+    ``spill_path`` as CSV when one is configured.
+
+    ``timestamp`` is the bot's clock when the row was recorded and never goes
+    backwards, which the time filters rely on; the order's own timestamp is
+    kept as ``exchange_time``.
+    """
+
+    def __init__(self, capacity: int = 10000, spill_path: Optional[str] = None):
+        if capacity <= 0:
+            raise ValueError("Blotter capacity must be positive")
+
+        self.capacity = capacity
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._spill_file = None
+        self._spill_writer = None
+
+        self._seq = array('q', [0]) * capacity
+        self._timestamp = array('d', [0.0]) * capacity
+        self._exchange_time = array('d', [0.0]) * capacity
+        self._symbol = array('l', [0]) * capacity
+        self._side = array('b', [0]) * capacity
+        self._quantity = array('d', [0.0]) * capacity
+        self._price = array('d', [0.0]) * capacity
+        self._status = array('b', [0]) * capacity
+        self._order_id: List[Optional[str]] = [None] * capacity
+
+        # symbol name <-> id, and the in-buffer seq numbers for each symbol
+        self._symbols: List[str] = []
+        self._symbol_ids: Dict[str, int] = {}
+        self._by_symbol: Dict[int, List[int]] = {}
+        self._by_symbol_head: Dict[int, int] = {}
+
+        self._first_seq = 0
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return self._next_seq - self.oldest_seq
+
+    @property
+    def oldest_seq(self) -> int:
+        """Sequence number of the oldest row still held in memory."""
+        return max(self._first_seq, self._next_seq - self.capacity)
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next recorded row will receive."""
+        return self._next_seq
+
+    def record(self, order) -> int:
+        """Append an order or fill (an ``OrderResponse``) and return its sequence number."""
+        exchange_time = order.timestamp
+        if isinstance(exchange_time, datetime):
+            exchange_time = exchange_time.timestamp()
+        timestamp = get_clock().time()
+        if len(self):
+            timestamp = max(timestamp, self._timestamp[(self._next_seq - 1) % self.capacity])
+        return self._store(order.order_id, order.symbol, order.side, order.quantity,
+                           order.price, order.status, timestamp, exchange_time)
+
+    def append(self, row: Dict) -> int:
+        """Append a row copied from another blotter, keeping its seq and timestamps.
+
+        ``row`` is in the form returned by ``get()``. An empty blotter starts
+        numbering at the first row's seq; later rows must follow on directly.
+        """
+        if not len(self):
+            self._first_seq = self._next_seq = row['seq']
+        elif row['seq'] != self._next_seq:
+            raise ValueError(f"Expected blotter row {self._next_seq}, got {row['seq']}")
+        return self._store(row['order_id'], row['symbol'], row['side'], row['quantity'],
+                           row['price'], row['status'], row['timestamp'], row['exchange_time'])
+
+    def _store(self, order_id, symbol: str, side: str, quantity: float, price: float,
+               status: str, timestamp: float, exchange_time: float) -> int:
+        # Validate before evicting so a bad row leaves the buffer untouched
+        side_code = SIDES.get(side.lower())
+        if side_code is None:
+            raise ValueError(f"Unknown order side: {side}")
+        if status.lower() not in STATUSES:
+            raise ValueError(f"Unknown order status: {status}")
+
+        seq = self._next_seq
+        slot = seq % self.capacity
+        if seq - self.capacity >= self._first_seq:
+            self._evict(slot)
+
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self._symbols)
+            self._symbols.append(symbol)
+            self._symbol_ids[symbol] = symbol_id
+            self._by_symbol[symbol_id] = []
+            self._by_symbol_head[symbol_id] = 0
+
+        self._seq[slot] = seq
+        self._timestamp[slot] = float(timestamp)
+        self._exchange_time[slot] = float(exchange_time)
+        self._symbol[slot] = symbol_id
+        self._side[slot] = side_code
+        self._quantity[slot] = float(quantity)
+        self._price[slot] = float(price)
+        self._status[slot] = STATUSES.index(status.lower())
+        self._order_id[slot] = str(order_id)
+        self._by_symbol[symbol_id].append(seq)
+
+        self._next_seq += 1
+        return seq
+
+    def _evict(self, slot: int) -> None:
+        """Drop the row currently in ``slot``, spilling it to disk if configured."""
+        symbol_id = self._symbol[slot]
+        seqs = self._by_symbol[symbol_id]
+        head = self._by_symbol_head[symbol_id] + 1
+        # Compact the per-symbol index once half of it is stale
+        if head > 1024 and head * 2 > len(seqs):
+            del seqs[:head]
+            head = 0
+        self._by_symbol_head[symbol_id] = head
+
+        if self.spill_path is not None:
+            if self._spill_writer is None:
+                self._open_spill()
+            row = self._row(self._seq[slot])
+            self._spill_writer.writerow([row[field] for field in FIELDS])
+            # Evictions are rare next to ticks, so flush each one to survive a crash
+            self._spill_file.flush()
+
+    def _open_spill(self) -> None:
+        """Open the spill file for appending, writing a header if it is new."""
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.spill_path.exists() or self.spill_path.stat().st_size == 0
+        self._spill_file = open(self.spill_path, 'a', newline='')
+        self._spill_writer = csv.writer(self._spill_file)
+        if is_new:
+            self._spill_writer.writerow(FIELDS)
+        logger.info(f"Spilling evicted blotter rows to {self.spill_path}")
+
+    def close(self) -> None:
+        """Flush and close the spill file."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+            self._spill_writer = None
+
+    def _row(self, seq: int) -> Dict:
+        """Materialise the row with sequence number ``seq`` as a dict."""
+        slot = seq % self.capacity
+        return {
+            'seq': seq,
+            'timestamp': self._timestamp[slot],
+            'exchange_time': self._exchange_time[slot],
+            'order_id': self._order_id[slot],
+            'symbol': self._symbols[self._symbol[slot]],
+            'side': 'buy' if self._side[slot] > 0 else 'sell',
+            'quantity': self._quantity[slot],
+            'price': self._price[slot],
+            'status': STATUSES[self._status[slot]]
+        }
+
+    def get(self, seq: int) -> Optional[Dict]:
+        """Return a single row by sequence number, or None if it is not in memory."""
+        if seq < self.oldest_seq or seq >= self._next_seq:
+            return None
+        return self._row(seq)
+
+    def _seq_at_time(self, timestamp: float, right: bool = False) -> int:
+        """Binary search for the first in-memory seq at (or after, if ``right``) a timestamp."""
+        lo, hi = self.oldest_seq, self._next_seq
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self._timestamp[mid % self.capacity]
+            if value < timestamp or (right and value == timestamp):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _select(self, symbol: Optional[str], start: Optional[float],
+                end: Optional[float], cursor: Optional[int]) -> Optional[tuple]:
+        """Resolve filters to a seq window and, for symbol queries, its index slice."""
+        lo, hi = self.oldest_seq, self._next_seq
+        if cursor is not None:
+            hi = min(hi, cursor)
+        if start is not None:
+            lo = max(lo, self._seq_at_time(start))
+        if end is not None:
+            hi = min(hi, self._seq_at_time(end, right=True))
+        if lo >= hi:
+            return None
+
+        if symbol is None:
+            return lo, hi, None
+
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            return None
+        seqs = self._by_symbol[symbol_id]
+        head = self._by_symbol_head[symbol_id]
+        return bisect_left(seqs, lo, head), bisect_left(seqs, hi, head), seqs
+
+    def page(self, symbol: Optional[str] = None, start: Optional[float] = None,
+             end: Optional[float] = None, cursor: Optional[int] = None,
+             limit: int = 100) -> Dict:
+        """Return up to ``limit`` rows, newest first, older than ``cursor``.
+
+        The returned ``next_cursor`` is passed back to fetch the following page
+        and is None once the in-memory history has been exhausted.
+        """
+        limit = max(1, limit)
+        selection = self._select(symbol, start, end, cursor)
+        if selection is None:
+            return {'trades': [], 'next_cursor': None}
+
+        lo, hi, seqs = selection
+        positions = range(hi - 1, max(lo, hi - limit) - 1, -1)
+        page = positions if seqs is None else [seqs[i] for i in positions]
+
+        trades = [self._row(seq) for seq in page]
+        return {
+            'trades': trades,
+            'next_cursor': trades[-1]['seq'] if hi - limit > lo else None
+        }
+
+    def iter_rows(self, symbol: Optional[str] = None, start: Optional[float] = None,
+                  end: Optional[float] = None) -> Iterator[Dict]:
+        """Iterate over matching in-memory rows, oldest first.
+
+        Rows evicted while the caller is suspended between items are skipped,
+        as their slots then hold newer rows.
+        """
+        selection = self._select(symbol, start, end, None)
+        if selection is None:
+            return
+        lo, hi, seqs = selection
+        for i in range(lo, hi):
+            seq = i if seqs is None else seqs[i]
+            if seq >= self.oldest_seq:
+                yield self._row(seq)
+
+    def columns(self, symbol: Optional[str] = None, start: Optional[float] = None,
+                end: Optional[float] = None) -> Dict[str, list]:
+        """Return matching rows as a dict of column lists, for columnar export."""
+        columns = {field: [] for field in FIELDS}
+        for row in self.iter_rows(symbol, start, end):
+            for field in FIELDS:
+                columns[field].append(row[field])
+        return columns
@@ -0,0 +1,120 @@
+import asyncio
+import selectors
+import time
+from datetime import datetime
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class Clock:
+    """Wall-clock time source."""
+
+    def time(self) -> float:
+        """Seconds since the epoch."""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Seconds from an arbitrary origin, for measuring intervals."""
+        return time.monotonic()
+
+    def now(self) -> datetime:
+        """Current local time as a datetime."""
+        return datetime.fromtimestamp(self.time())
+
+
+class VirtualClock(Clock):
+    """Clock that only moves when advanced.
+
+    Elapsed time is kept separately from the epoch start so that small
+    advances do not get lost in float rounding of large timestamps.
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        self.start = time.time() if start is None else start
+        self.elapsed = 0.0
+
+    def time(self) -> float:
+        return self.start + self.elapsed
+
+    def monotonic(self) -> float:
+        return self.elapsed
+
+    def advance(self, seconds: float) -> None:
+        if seconds > 0:
+            self.elapsed += seconds
+
+
+_clock: Clock = Clock()
+
+
+def get_clock() -> Clock:
+    """The clock used for timestamps across the bot."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Install ``clock`` globally and return the previous one."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+class _VirtualSelector:
+    """Selector that advances a virtual clock instead of waiting on timers.
+
+    Ready I/O is still polled, and the loop blocks on real I/O only when no
+    timer is scheduled at all.
+    """
+
+    def __init__(self, clock: VirtualClock):
+        self._selector = selectors.DefaultSelector()
+        self._clock = clock
+
+    def select(self, timeout: Optional[float] = None):
+        if timeout is None:
+            return self._selector.select(None)
+        events = self._selector.select(0)
+        if not events:
+            self._clock.advance(timeout)
+        return events
+
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose time jumps straight to the next scheduled callback.
+
+    ``asyncio.sleep`` and other timers complete as soon as nothing else is
+    ready, so hours of bot activity replay in seconds.
+    """
+
+    def __init__(self, clock: VirtualClock):
+        super().__init__(_VirtualSelector(clock))
+        self.clock = clock
+
+    def time(self) -> float:
+        return self.clock.monotonic()
+
+
+def run_virtual(main: Awaitable[T], start: Optional[float] = None) -> T:
+    """Run ``main`` on a virtual-time loop with the global clock switched to it."""
+    clock = VirtualClock(start)
+    previous = set_clock(clock)
+    loop = VirtualTimeEventLoop(clock)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            # Cancel leftover tasks, as asyncio.run() does
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+            set_clock(previous)
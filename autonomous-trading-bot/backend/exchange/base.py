@@ -80,6 +80,10 @@ class BaseExchange(ABC):
         """Close an existing position."""
         pass
     
+    async def close(self) -> None:
+        """Release network resources; the bot calls this when it stops."""
+        pass
+    
     async def validate_order(self, order: OrderRequest) -> bool:
         """Validate order parameters."""
         if order.order_type == 'limit' and order.price is None:
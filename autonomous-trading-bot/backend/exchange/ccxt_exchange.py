@@ -0,0 +1,154 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import ccxt.async_support as ccxt
+
+from .base import BaseExchange, OrderRequest, OrderResponse, Position
+from ..clock import get_clock
+from ..logger import logger
+
+# ccxt order states in the bot's vocabulary (see blotter.STATUSES)
+ORDER_STATUSES = {'open': 'open', 'closed': 'filled', 'canceled': 'cancelled',
+                  'expired': 'cancelled', 'rejected': 'rejected'}
+
+class CCXTExchange(BaseExchange):
+    """Adapter for any exchange supported by ccxt.
+
+    The ccxt exchange id is ``exchange.ccxt_id`` or, failing that,
+    ``exchange.name``.
+    """
+
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        exchange_config = config['exchange']
+        self.exchange_id = exchange_config.get('ccxt_id', exchange_config['name'])
+        exchange_class = getattr(ccxt, self.exchange_id, None)
+        if exchange_class is None:
+            raise ValueError(f"Unknown exchange: {self.exchange_id}")
+
+        self.client = exchange_class({
+            'apiKey': exchange_config.get('apiKey', ''),
+            'secret': exchange_config.get('secret', ''),
+            'enableRateLimit': True
+        })
+        if exchange_config.get('testnet'):
+            self.client.set_sandbox_mode(True)
+
+    @staticmethod
+    def _symbol(symbol: str) -> str:
+        """Convert the bot's ``BTC-USDT`` symbols to ccxt's ``BTC/USDT``."""
+        return symbol.replace('-', '/')
+
+    @staticmethod
+    def _parse_order(data: Dict, symbol: str) -> OrderResponse:
+        """Build an OrderResponse from a ccxt order structure."""
+        timestamp = data.get('timestamp')
+        return OrderResponse(
+            order_id=str(data['id']),
+            symbol=symbol,
+            side=data['side'],
+            quantity=float(data.get('amount') or 0),
+            price=float(data.get('average') or data.get('price') or 0),
+            status=ORDER_STATUSES.get(data.get('status') or 'open', data.get('status')),
+            timestamp=datetime.fromtimestamp(timestamp / 1000) if timestamp else get_clock().now()
+        )
+
+    async def connect(self) -> bool:
+        """Load markets from the exchange."""
+        try:
+            await self.client.load_markets()
+            logger.info(f"Successfully connected to {self.exchange_id} via ccxt")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to {self.exchange_id}: {str(e)}")
+            return False
+
+    async def get_market_price(self, symbol: str) -> float:
+        """Get the last traded price."""
+        ticker = await self.client.fetch_ticker(self._symbol(symbol))
+        return float(ticker['last'])
+
+    async def get_balance(self) -> Dict[str, float]:
+        """Get free balances by currency."""
+        response = await self.client.fetch_balance()
+        return {currency: float(amount) for currency, amount in response['free'].items() if amount}
+
+    async def place_order(self, order: OrderRequest) -> OrderResponse:
+        """Place an order through ccxt."""
+        await self.validate_order(order)
+        params = {}
+        if order.stop_loss is not None:
+            params['stopLossPrice'] = order.stop_loss
+        if order.take_profit is not None:
+            params['takeProfitPrice'] = order.take_profit
+
+        response = await self.client.create_order(
+            self._symbol(order.symbol),
+            order.order_type,
+            order.side,
+            order.quantity,
+            order.price if order.order_type == 'limit' else None,
+            params
+        )
+        return self._parse_order(response, order.symbol)
+
+    async def cancel_order(self, order_id: str) -> bool:
+        """Cancel an order on the configured trading pair."""
+        try:
+            symbol = self._symbol(self.config.get('trading_pair', 'BTC-USDT'))
+            await self.client.cancel_order(order_id, symbol)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to cancel order {order_id}: {str(e)}")
+            return False
+
+    async def get_positions(self) -> List[Position]:
+        """Get open derivative positions; spot exchanges have none."""
+        if not self.client.has.get('fetchPositions'):
+            return []
+        positions = []
+        for pos in await self.client.fetch_positions():
+            contracts = float(pos.get('contracts') or 0)
+            if contracts == 0:
+                continue
+            timestamp = pos.get('timestamp')
+            positions.append(Position(
+                symbol=pos['symbol'].replace('/', '-').split(':')[0],
+                side='buy' if pos.get('side') == 'long' else 'sell',
+                quantity=contracts,
+                entry_price=float(pos.get('entryPrice') or 0),
+                current_price=float(pos.get('markPrice') or 0),
+                unrealized_pnl=float(pos.get('unrealizedPnl') or 0),
+                timestamp=datetime.fromtimestamp(timestamp / 1000) if timestamp else get_clock().now()
+            ))
+        return positions
+
+    async def update_position(self, symbol: str, current_price: float) -> None:
+        """Update position with current market price."""
+        for position in await self.get_positions():
+            if position.symbol == symbol:
+                position.current_price = current_price
+                position.unrealized_pnl = self.calculate_pnl(position, current_price)
+
+                # Check trailing stop loss
+                if await self.check_trailing_stop(symbol, current_price):
+                    await self.close_position(symbol)
+                    logger.info(f"Trailing stop loss triggered for {symbol}")
+                break
+
+    async def close_position(self, symbol: str) -> Optional[OrderResponse]:
+        """Close a position with a market order."""
+        position = next((p for p in await self.get_positions() if p.symbol == symbol), None)
+        if position is None:
+            return None
+
+        return await self.place_order(OrderRequest(
+            symbol=symbol,
+            side='sell' if position.side == 'buy' else 'buy',
+            quantity=position.quantity,
+            order_type='market'
+        ))
+
+    async def close(self) -> None:
+        """Release the ccxt HTTP session."""
+        await self.client.close()
@@ -1,13 +1,41 @@
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional
-import hmac
-import hashlib
+from typing import Dict, List, Optional, Tuple
 import time
 import aiohttp
+from . import encoding
 from .base import BaseExchange, OrderRequest, OrderResponse, Position
 from ..logger import logger
 
+# Delta order states in the bot's vocabulary (see blotter.STATUSES)
+ORDER_STATUSES = {'pending': 'new', 'open': 'open', 'closed': 'filled', 'cancelled': 'cancelled'}
+
+def _parse_order(data: Dict) -> OrderResponse:
+    """Build an OrderResponse from a Delta order payload."""
+    status = data['status'].lower()
+    return OrderResponse(
+        order_id=data['id'],
+        symbol=data['symbol'],
+        side=data['side'].lower(),
+        quantity=float(data['size']),
+        price=float(data['price']),
+        status=ORDER_STATUSES.get(status, status),
+        timestamp=datetime.fromtimestamp(data['created_at'] / 1000)
+    )
+
+def _parse_position(data: Dict) -> Position:
+    """Build a Position from a Delta position payload."""
+    size = float(data['size'])
+    return Position(
+        symbol=data['symbol'],
+        side='buy' if size > 0 else 'sell',
+        quantity=abs(size),
+        entry_price=float(data['entry_price']),
+        current_price=float(data['mark_price']),
+        unrealized_pnl=float(data['unrealized_pnl']),
+        timestamp=datetime.fromtimestamp(data['updated_at'] / 1000)
+    )
+
 class DeltaExchange(BaseExchange):
     """Delta Exchange implementation."""
     
@@ -17,47 +45,51 @@ class DeltaExchange(BaseExchange):
         self.api_secret = config['exchange']['secret']
         self.base_url = config['exchange']['base_url']
         self.session = None
+        self._signer = encoding.RequestSigner(self.api_secret)
+        self._headers = {
+            'api-key': self.api_key,
+            'Content-Type': 'application/json'
+        }
         
-    def _generate_signature(self, timestamp: str, method: str, path: str, body: str = '') -> str:
+    def _generate_signature(self, timestamp: str, method: str, path: str, body: bytes = b'') -> str:
         """Generate signature for Delta Exchange API authentication."""
-        message = timestamp + method + path + body
-        signature = hmac.new(
-            self.api_secret.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        return self._signer.sign(timestamp, method, path, body)
         
     async def _request(self, method: str, path: str, data: Dict = None) -> Dict:
-        """Make authenticated request to Delta Exchange API."""
+        """Make authenticated request to Delta Exchange API.
+        
+        The body is serialized once and the same bytes are signed and sent.
+        """
         if self.session is None:
             raise ValueError("Exchange not connected. Call connect() first.")
             
         timestamp = str(int(time.time() * 1000))
-        body = '' if data is None else str(data)
-        signature = self._generate_signature(timestamp, method, path, body)
+        body = b'' if data is None else encoding.dumps(data)
         
-        headers = {
-            'api-key': self.api_key,
-            'timestamp': timestamp,
-            'signature': signature,
-            'Content-Type': 'application/json'
-        }
+        headers = dict(self._headers)
+        headers['timestamp'] = timestamp
+        headers['signature'] = self._generate_signature(timestamp, method, path, body)
         
         url = f"{self.base_url}{path}"
         
         try:
-            async with self.session.request(method, url, json=data, headers=headers) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Delta Exchange API error: {error_text}")
-                    raise ValueError(f"API request failed: {error_text}")
-                    
-                return await response.json()
+            status, raw = await self._send(method, url, body, headers)
         except aiohttp.ClientError as e:
             logger.error(f"Network error in Delta Exchange API request: {str(e)}")
             raise
             
+        if status != 200:
+            error_text = raw.decode(errors='replace')
+            logger.error(f"Delta Exchange API error: {error_text}")
+            raise ValueError(f"API request failed: {error_text}")
+            
+        return encoding.loads(raw)
+        
+    async def _send(self, method: str, url: str, body: bytes, headers: Dict) -> Tuple[int, bytes]:
+        """Send a prepared request and return the status and raw response body."""
+        async with self.session.request(method, url, data=body or None, headers=headers) as response:
+            return response.status, await response.read()
+            
     async def connect(self) -> bool:
         """Establish connection to Delta Exchange."""
         self.session = aiohttp.ClientSession()
@@ -99,16 +131,7 @@ class DeltaExchange(BaseExchange):
         }
         
         response = await self._request('POST', '/v2/orders', data)
-        
-        return OrderResponse(
-            order_id=response['id'],
-            symbol=response['symbol'],
-            side=response['side'].lower(),
-            quantity=float(response['size']),
-            price=float(response['price']),
-            status=response['status'].lower(),
-            timestamp=datetime.fromtimestamp(response['created_at'] / 1000)
-        )
+        return _parse_order(response)
         
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel order on Delta Exchange."""
@@ -122,22 +145,8 @@ class DeltaExchange(BaseExchange):
     async def get_positions(self) -> List[Position]:
         """Get current positions from Delta Exchange."""
         response = await self._request('GET', '/v2/positions')
-        positions = []
-        
-        for pos in response:
-            if float(pos['size']) != 0:  # Only include non-zero positions
-                position = Position(
-                    symbol=pos['symbol'],
-                    side='buy' if float(pos['size']) > 0 else 'sell',
-                    quantity=abs(float(pos['size'])),
-                    entry_price=float(pos['entry_price']),
-                    current_price=float(pos['mark_price']),
-                    unrealized_pnl=float(pos['unrealized_pnl']),
-                    timestamp=datetime.fromtimestamp(pos['updated_at'] / 1000)
-                )
-                positions.append(position)
-                
-        return positions
+        # Only include non-zero positions
+        return [_parse_position(pos) for pos in response if float(pos['size']) != 0]
         
     async def update_position(self, symbol: str, current_price: float) -> None:
         """Update position with current market price."""
@@ -170,6 +179,12 @@ class DeltaExchange(BaseExchange):
         
         return await self.place_order(close_order)
         
+    async def close(self) -> None:
+        """Close the HTTP session; connect() opens a new one."""
+        if self.session:
+            await self.session.close()
+            self.session = None
+            
     async def __del__(self):
         """Cleanup resources."""
         if self.session:
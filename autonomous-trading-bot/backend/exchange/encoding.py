@@ -0,0 +1,39 @@
+import hashlib
+import hmac
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize a request body to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def loads(raw: bytes) -> Any:
+    """Parse a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class RequestSigner:
+    """HMAC-SHA256 request signer with the keyed state computed once."""
+
+    def __init__(self, secret: str):
+        self._key_state = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+    def sign(self, timestamp: str, method: str, path: str, body: bytes = b'') -> str:
+        """Sign ``timestamp + method + path + body`` and return the hex digest."""
+        mac = self._key_state.copy()
+        mac.update((timestamp + method + path).encode())
+        mac.update(body)
+        return mac.hexdigest()
@@ -1,7 +1,7 @@
-from datetime import datetime
 from collections import namedtuple
-import random
-from .base import BaseExchange
+from .base import BaseExchange, OrderRequest
+from ..clock import get_clock
+from ..market_sim import MarketSimulator
 
 OrderResponse = namedtuple('OrderResponse', ['order_id', 'symbol', 'side', 'quantity', 'price', 'status', 'timestamp'])
 
@@ -15,11 +15,18 @@ class PaperTradingExchange(BaseExchange):
                 }
             }
         super().__init__(config)
-        self.balance = 10000.0  # Initial balance in USDT
+        paper_config = config.get('paper_trading')
+        if not isinstance(paper_config, dict):
+            paper_config = {}
+        self.balance = float(paper_config.get('initial_balance', 10000.0))  # Initial balance in USDT
+        self.fee_percent = config.get('fees', {}).get('taker_percent', 0.0)
         self.positions = {}  # symbol -> {quantity, entry_price}
         self.order_counter = 0
-        self.last_price = 50000.0  # Initial BTC price
         self.orders = {}  # order_id -> OrderResponse
+        
+        symbols = paper_config.get('symbols') or [config.get('trading_pair', 'BTC-USDT')]
+        self.simulator = MarketSimulator.from_config(config, symbols)
+        self.last_prices = dict(zip(self.simulator.symbols, self.simulator.initial_prices.tolist()))
 
     async def connect(self):
         """Connect to the exchange."""
@@ -28,7 +35,7 @@ class PaperTradingExchange(BaseExchange):
     async def get_balance(self) -> dict:
         """Get balance for all assets."""
         btc_balance = sum(pos['quantity'] for pos in self.positions.values())
-        btc_value = btc_balance * self.last_price
+        btc_value = sum(pos['quantity'] * self._last_price(symbol) for symbol, pos in self.positions.items())
         return {
             'USDT': round(self.balance, 2),
             'BTC': round(btc_balance, 8),
@@ -43,7 +50,7 @@ class PaperTradingExchange(BaseExchange):
         """Get open positions."""
         positions = []
         for symbol, pos in self.positions.items():
-            current_price = await self.get_market_price(symbol)
+            current_price = self._last_price(symbol)
             pnl = (current_price - pos['entry_price']) * pos['quantity']
             positions.append({
                 'symbol': symbol,
@@ -55,21 +62,27 @@ class PaperTradingExchange(BaseExchange):
         return positions
 
     async def get_market_price(self, symbol: str) -> float:
-        """Get current market price."""
-        self.last_price = self._get_simulated_price()
-        return self.last_price
+        """Advance the simulated market one tick and return the price of ``symbol``.
+
+        Only the bot's market loop should call this; everything else reads the
+        last price, so a seeded run does not depend on how often status is polled.
+        """
+        prices = self.simulator.step()
+        self.last_prices = dict(zip(self.simulator.symbols, prices.tolist()))
+        return self._last_price(symbol)
 
-    async def place_order(self, symbol: str, side: str, quantity: float, price: float = None) -> OrderResponse:
-        """Place a paper trade order."""
+    async def place_order(self, order: OrderRequest) -> OrderResponse:
+        """Place a paper trade order; every order fills at once at the last price."""
+        symbol, side, quantity = order.symbol, order.side, order.quantity
         self.order_counter += 1
         order_id = f'paper_order_{self.order_counter}'
         
-        # Get current price
-        price = await self.get_market_price(symbol)
+        # Fill at the last simulated price
+        price = self._last_price(symbol)
         
         # Update positions and balance
         if side == 'buy':
-            cost = price * quantity
+            cost = price * quantity * (1 + self.fee_percent / 100)
             if cost > self.balance:
                 raise ValueError("Insufficient balance")
             
@@ -94,7 +107,7 @@ class PaperTradingExchange(BaseExchange):
             if symbol not in self.positions or self.positions[symbol]['quantity'] < quantity:
                 raise ValueError("Insufficient position size")
             
-            revenue = price * quantity
+            revenue = price * quantity * (1 - self.fee_percent / 100)
             self.balance += revenue
             
             # Update position
@@ -110,7 +123,7 @@ class PaperTradingExchange(BaseExchange):
             quantity=quantity,
             price=price,
             status='filled',
-            timestamp=datetime.now()
+            timestamp=get_clock().now()
         )
         
         self.orders[order_id] = order
@@ -153,14 +166,15 @@ class PaperTradingExchange(BaseExchange):
             raise ValueError(f"No position found for {symbol}")
             
         position = self.positions[symbol]
-        return await self.place_order(
+        return await self.place_order(OrderRequest(
             symbol=symbol,
             side='sell',
-            quantity=position['quantity']
-        )
+            quantity=position['quantity'],
+            order_type='market'
+        ))
 
-    def _get_simulated_price(self) -> float:
-        """Simulate price movement."""
-        change_percent = random.uniform(-0.1, 0.1)  # -0.1% to +0.1% change
-        self.last_price *= (1 + change_percent)
-        return self.last_price
+    def _last_price(self, symbol: str) -> float:
+        """Price of ``symbol`` at the current simulator tick."""
+        if symbol not in self.last_prices:
+            raise ValueError(f"Unknown symbol for simulation: {symbol}")
+        return self.last_prices[symbol]
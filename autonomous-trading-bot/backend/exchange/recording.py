@@ -0,0 +1,204 @@
+import asyncio
+import random
+import struct
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import aiohttp
+
+from .delta import DeltaExchange
+from ..clock import get_clock
+from ..logger import logger
+
+MAGIC = b'TBCAP1\n'
+# kind, wall time, duration, HTTP status, then the lengths of method, path,
+# request body and response body, which follow as raw bytes
+RECORD = struct.Struct('!BddHBHII')
+PRICE = struct.Struct('!d')
+
+KIND_HTTP = 1
+KIND_TICK = 2
+
+@dataclass
+class CaptureRecord:
+    kind: int
+    timestamp: float
+    duration: float
+    status: int  # 0 for a network error, whose message is the response
+    method: str
+    path: str
+    request: bytes
+    response: bytes
+
+class CaptureWriter:
+    """Append-only binary capture of exchange I/O.
+
+    Each record is flushed as it is written so a capture survives a crash.
+    A capture file must have a single writer; processes record to files of
+    their own.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = open(self.path, 'ab')
+        if is_new:
+            self._file.write(MAGIC)
+            self._file.flush()
+
+    def write(self, record: CaptureRecord) -> None:
+        method = record.method.encode()
+        path = record.path.encode()
+        self._file.write(RECORD.pack(
+            record.kind, record.timestamp, record.duration, record.status,
+            len(method), len(path), len(record.request), len(record.response)
+        ))
+        self._file.write(method + path + record.request + record.response)
+        self._file.flush()
+
+    def write_tick(self, symbol: str, timestamp: float, price: float) -> None:
+        """Record a market data tick."""
+        self.write(CaptureRecord(KIND_TICK, timestamp, 0.0, 0, '', symbol, b'', PRICE.pack(price)))
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self) -> None:
+        self._file.close()
+
+def read_capture(path: str) -> Iterator[CaptureRecord]:
+    """Iterate over the records of a capture file."""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a capture file: {path}")
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return  # end of file, or a record cut short by a crash
+            kind, timestamp, duration, status, n_method, n_path, n_request, n_response = RECORD.unpack(header)
+            data = f.read(n_method + n_path + n_request + n_response)
+            if len(data) < n_method + n_path + n_request + n_response:
+                return
+            method = data[:n_method].decode()
+            path = data[n_method:n_method + n_path].decode()
+            request = data[n_method + n_path:n_method + n_path + n_request]
+            response = data[n_method + n_path + n_request:]
+            yield CaptureRecord(kind, timestamp, duration, status, method, path, request, response)
+
+def read_ticks(path: str) -> Iterator[Tuple[str, float, float]]:
+    """Iterate over the (symbol, timestamp, price) ticks of a capture file."""
+    for record in read_capture(path):
+        if record.kind == KIND_TICK:
+            yield record.path, record.timestamp, PRICE.unpack(record.response)[0]
+
+class RecordingDeltaExchange(DeltaExchange):
+    """DeltaExchange that appends every request, response and its timing to a capture file.
+
+    The file is open only between connect() and close(), so an exchange that
+    is replaced after a config reload does not leave a second writer behind.
+    """
+
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        self.capture_path = config['exchange']['capture']['path']
+        self.capture = None
+
+    async def connect(self) -> bool:
+        """Open the capture file and connect."""
+        if self.capture is None or self.capture.closed:
+            self.capture = CaptureWriter(self.capture_path)
+            logger.info(f"Recording Delta Exchange I/O to {self.capture.path}")
+        return await super().connect()
+
+    async def close(self) -> None:
+        """Close the HTTP session and the capture file."""
+        await super().close()
+        if self.capture is not None:
+            self.capture.close()
+
+    async def _send(self, method: str, url: str, body: bytes, headers: Dict) -> Tuple[int, bytes]:
+        clock = get_clock()
+        timestamp = clock.time()
+        started = clock.monotonic()
+        path = url[len(self.base_url):]
+        try:
+            status, raw = await super()._send(method, url, body, headers)
+        except aiohttp.ClientError as e:
+            self.capture.write(CaptureRecord(
+                KIND_HTTP, timestamp, clock.monotonic() - started, 0, method, path, body, str(e).encode()
+            ))
+            raise
+        self.capture.write(CaptureRecord(
+            KIND_HTTP, timestamp, clock.monotonic() - started, status, method, path, body, raw
+        ))
+        return status, raw
+
+class _ReplaySession:
+    """Stands in for the HTTP session; replayed requests never reach it."""
+
+    async def close(self):
+        pass
+
+class ReplayExchange(DeltaExchange):
+    """DeltaExchange served from a capture file instead of the network.
+
+    Responses are matched to requests by method and path, in recorded order,
+    and delayed by their recorded duration divided by ``speed`` (0 means no
+    delay). Extra latency, jitter and random network errors can be injected
+    for load and failure testing; ``seed`` makes the injection repeatable.
+    """
+
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        capture_config = config['exchange']['capture']
+        self.speed = capture_config.get('speed', 1.0)
+        self.latency = capture_config.get('latency_ms', 0) / 1000
+        self.jitter = capture_config.get('jitter_ms', 0) / 1000
+        self.error_rate = capture_config.get('error_rate', 0.0)
+        self.loop = capture_config.get('loop', False)
+        self.random = random.Random(capture_config.get('seed'))
+
+        self._recorded: Dict[Tuple[str, str], List[CaptureRecord]] = {}
+        for record in read_capture(capture_config['path']):
+            if record.kind == KIND_HTTP:
+                self._recorded.setdefault((record.method, record.path), []).append(record)
+        self._queues = {key: deque(records) for key, records in self._recorded.items()}
+        logger.info(f"Replaying Delta Exchange I/O from {capture_config['path']}")
+
+    async def connect(self) -> bool:
+        """Start serving from the capture; no network connection is made."""
+        self.session = _ReplaySession()
+        try:
+            await self._request('GET', '/v2/time')
+            return True
+        except Exception as e:
+            logger.error(f"Failed to replay connection to Delta Exchange: {str(e)}")
+            return False
+
+    def _next_record(self, method: str, path: str) -> CaptureRecord:
+        key = (method, path)
+        queue = self._queues.get(key)
+        if not queue and self.loop and key in self._recorded:
+            queue = self._queues[key] = deque(self._recorded[key])
+        if not queue:
+            raise ValueError(f"No recorded response for {method} {path}")
+        return queue.popleft()
+
+    async def _send(self, method: str, url: str, body: bytes, headers: Dict) -> Tuple[int, bytes]:
+        record = self._next_record(method, url[len(self.base_url):])
+
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if self.speed:
+            delay += record.duration / self.speed
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            raise aiohttp.ClientConnectionError("Injected replay error")
+        if record.status == 0:
+            raise aiohttp.ClientConnectionError(record.response.decode(errors='replace'))
+        return record.status, record.response
@@ -0,0 +1,66 @@
+import importlib
+from typing import Dict, Type
+
+from .base import BaseExchange
+
+# Exchange name -> "module:Class". Modules are imported on first use, so
+# paper trading never loads the HTTP client stacks of the live backends.
+EXCHANGES: Dict[str, str] = {
+    'paper': '.paper_trade:PaperTradingExchange',
+    'delta': '.delta:DeltaExchange',
+    'delta-record': '.recording:RecordingDeltaExchange',
+    'replay': '.recording:ReplayExchange',
+    'ccxt': '.ccxt_exchange:CCXTExchange'
+}
+
+_classes: Dict[str, Type[BaseExchange]] = {}
+
+
+def register_exchange(name: str, path: str) -> None:
+    """Register an exchange backend as ``"module:Class"`` under ``name``.
+
+    Relative module names resolve against ``backend.exchange``.
+    """
+    EXCHANGES[name] = path
+    _classes.pop(name, None)
+
+
+def get_exchange_class(name: str) -> Type[BaseExchange]:
+    """Return the backend class for ``name``, importing its module if needed.
+
+    Names that are not registered are treated as ccxt exchange ids and served
+    by the ccxt adapter.
+    """
+    if name not in EXCHANGES:
+        name = 'ccxt'
+    cls = _classes.get(name)
+    if cls is None:
+        module_name, class_name = EXCHANGES[name].split(':')
+        cls = getattr(importlib.import_module(module_name, __package__), class_name)
+        _classes[name] = cls
+    return cls
+
+
+def exchange_name(config: Dict) -> str:
+    """Backend name for a config: ``paper`` in paper mode, else ``exchange.name``.
+
+    ``exchange.capture.mode`` switches Delta to its recording backend
+    (``record``) or serves any live config from a capture file (``replay``).
+    """
+    if config.get('trading_mode', 'paper') == 'paper':
+        return 'paper'
+    exchange_config = config.get('exchange', {})
+    name = exchange_config.get('name', 'delta')
+    capture_mode = exchange_config.get('capture', {}).get('mode')
+    if capture_mode == 'replay':
+        return 'replay'
+    if capture_mode == 'record':
+        if name != 'delta':
+            raise ValueError(f"Recording is not supported for exchange: {name}")
+        return 'delta-record'
+    return name
+
+
+def create_exchange(config: Dict) -> BaseExchange:
+    """Instantiate the exchange backend selected by ``config``."""
+    return get_exchange_class(exchange_name(config))(config)
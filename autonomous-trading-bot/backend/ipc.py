@@ -0,0 +1,167 @@
+import asyncio
+import itertools
+import struct
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .exchange import encoding
+from .logger import logger
+
+# Every frame is a 1-byte message type and a 4-byte payload length
+HEADER = struct.Struct('!BI')
+# Tick payload: timestamp, price, then the UTF-8 symbol
+TICK = struct.Struct('!dd')
+MAX_PAYLOAD = 64 * 1024 * 1024
+
+MSG_TICK = 1       # market data -> strategy -> subscribers
+MSG_REQUEST = 2    # web -> strategy, JSON {"id", "method", "params"}
+MSG_REPLY = 3      # strategy -> web, JSON {"id", "result"} or {"id", "error"}
+MSG_STATUS = 4     # strategy -> subscribers, pre-serialized status JSON
+MSG_SUBSCRIBE = 5  # web -> strategy, start receiving status, tick and trade frames
+MSG_TRADE = 6      # strategy -> subscribers, JSON blotter row
+MSG_SNAPSHOT = 7   # strategy -> subscriber, JSON blotter and price history
+
+
+def pack(msg_type: int, payload: bytes = b'') -> bytes:
+    """Frame a payload."""
+    return HEADER.pack(msg_type, len(payload)) + payload
+
+
+def pack_json(msg_type: int, data: Any) -> bytes:
+    """Frame a JSON payload."""
+    return pack(msg_type, encoding.dumps(data))
+
+
+def pack_tick(symbol: str, timestamp: float, price: float) -> bytes:
+    """Frame a market tick."""
+    return pack(MSG_TICK, TICK.pack(timestamp, price) + symbol.encode())
+
+
+def unpack_tick(payload: bytes) -> Tuple[str, float, float]:
+    """Decode a tick payload into (symbol, timestamp, price)."""
+    timestamp, price = TICK.unpack_from(payload)
+    return payload[TICK.size:].decode(), timestamp, price
+
+
+async def read_message(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """Read one frame. Raises ``asyncio.IncompleteReadError`` when the peer closes."""
+    msg_type, length = HEADER.unpack(await reader.readexactly(HEADER.size))
+    if length > MAX_PAYLOAD:
+        raise ValueError(f"IPC message too large: {length} bytes")
+    payload = await reader.readexactly(length) if length else b''
+    return msg_type, payload
+
+
+class IPCClient:
+    """Connection to the strategy process's Unix socket.
+
+    Reconnects automatically, matches replies to requests and keeps the most
+    recent status frame as raw JSON bytes. Other frames are passed to the
+    handler registered for their message type in ``handlers``.
+    """
+
+    def __init__(self, path: str, subscribe: bool = False, retry_delay: float = 0.5,
+                 handlers: Optional[Dict[int, Callable[[bytes], None]]] = None):
+        self.path = path
+        self.subscribe = subscribe
+        self.handlers = handlers or {}
+        self.retry_delay = retry_delay
+        self.status: Optional[bytes] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connected = asyncio.Event()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._task = None
+
+    async def start(self, wait: bool = True) -> None:
+        """Start the background connection loop, optionally waiting until connected."""
+        self._task = asyncio.create_task(self._run())
+        if wait:
+            await self._connected.wait()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, self._writer = await asyncio.open_unix_connection(self.path)
+            except OSError:
+                await asyncio.sleep(self.retry_delay)
+                continue
+
+            logger.info(f"Connected to strategy process at {self.path}")
+            if self.subscribe:
+                self._writer.write(pack(MSG_SUBSCRIBE))
+            self._connected.set()
+            try:
+                while True:
+                    msg_type, payload = await read_message(reader)
+                    if msg_type == MSG_STATUS:
+                        self.status = payload
+                    elif msg_type == MSG_REPLY:
+                        self._resolve(encoding.loads(payload))
+                    elif msg_type in self.handlers:
+                        try:
+                            self.handlers[msg_type](payload)
+                        except Exception as e:
+                            logger.error(f"Error handling IPC message {msg_type}: {str(e)}")
+            except (asyncio.IncompleteReadError, ConnectionError) as e:
+                logger.error(f"Lost connection to strategy process: {str(e)}")
+            finally:
+                self._connected.clear()
+                self.status = None
+                self._writer.close()
+                self._writer = None
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(ConnectionError("Strategy process disconnected"))
+                self._pending.clear()
+            await asyncio.sleep(self.retry_delay)
+
+    def _resolve(self, reply: Dict) -> None:
+        future = self._pending.pop(reply.get('id'), None)
+        if future is None or future.done():
+            return
+        if 'error' in reply:
+            future.set_exception(RuntimeError(reply['error']))
+        else:
+            future.set_result(reply.get('result'))
+
+    async def send(self, frame: bytes) -> None:
+        """Send a pre-framed message, waiting for a connection if necessary."""
+        await self._connected.wait()
+        self._writer.write(frame)
+        await self._writer.drain()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    async def call(self, method: str, params: Optional[Dict] = None,
+                   timeout: float = 10.0) -> Any:
+        """Invoke ``method`` in the strategy process and return its result.
+
+        Raises ``ConnectionError`` at once while the strategy process is down
+        rather than waiting for it to restart.
+        """
+        if not self.connected:
+            raise ConnectionError("Strategy process unavailable")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            frame = pack_json(MSG_REQUEST, {
+                'id': request_id,
+                'method': method,
+                'params': params or {}
+            })
+            return await asyncio.wait_for(self._request(frame, future), timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _request(self, frame: bytes, future: asyncio.Future) -> Any:
+        await self.send(frame)
+        return await future
@@ -1,7 +1,16 @@
 import logging
-from datetime import datetime
 import os
 
+from .clock import get_clock
+
+class ClockFilter(logging.Filter):
+    """Stamp log records with the bot's clock rather than the wall clock."""
+    
+    def filter(self, record):
+        record.created = get_clock().time()
+        record.msecs = (record.created - int(record.created)) * 1000
+        return True
+
 def setup_logger():
     """Set up the logger for the trading bot."""
     # Create logs directory if it doesn't exist
@@ -18,7 +27,7 @@ def setup_logger():
     console_handler.setLevel(logging.INFO)
     
     # File handler - new log file for each session
-    log_filename = f'logs/trading_bot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+    log_filename = f'logs/trading_bot_{get_clock().now().strftime("%Y%m%d_%H%M%S")}.log'
     file_handler = logging.FileHandler(log_filename)
     file_handler.setLevel(logging.INFO)
     
@@ -29,6 +38,7 @@ def setup_logger():
     file_handler.setFormatter(formatter)
     
     # Add handlers to the logger
+    logger.addFilter(ClockFilter())
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
     
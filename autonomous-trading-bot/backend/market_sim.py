@@ -0,0 +1,277 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class PriceModel(ABC):
+    """Base class for price path models.
+
+    Models turn a block of (already correlated) standard normal shocks into
+    prices, continuing from ``start_prices``. Any state a model keeps between
+    blocks (regime, replay position) lives on the model instance.
+    """
+
+    @abstractmethod
+    def generate(self, rng: np.random.Generator, shocks: np.ndarray,
+                 start_prices: np.ndarray) -> np.ndarray:
+        """Return an array of prices shaped like ``shocks`` (ticks x symbols)."""
+        pass
+
+    def reset(self) -> None:
+        """Forget any state carried between blocks."""
+        pass
+
+
+class GBMModel(PriceModel):
+    """Geometric Brownian motion with per-tick drift and volatility."""
+
+    def __init__(self, drift: float = 0.0, volatility: float = 0.001):
+        self.drift = drift
+        self.volatility = volatility
+
+    def log_returns(self, rng: np.random.Generator, shocks: np.ndarray) -> np.ndarray:
+        """Per-tick log returns for a block of shocks."""
+        return (self.drift - 0.5 * self.volatility ** 2) + self.volatility * shocks
+
+    def generate(self, rng, shocks, start_prices):
+        return start_prices * np.exp(np.cumsum(self.log_returns(rng, shocks), axis=0))
+
+
+class JumpDiffusionModel(GBMModel):
+    """Merton jump-diffusion: GBM plus Poisson-arriving normal jumps in log price."""
+
+    def __init__(self, drift: float = 0.0, volatility: float = 0.001,
+                 jump_intensity: float = 0.001, jump_mean: float = 0.0,
+                 jump_std: float = 0.02):
+        super().__init__(drift, volatility)
+        self.jump_intensity = jump_intensity
+        self.jump_mean = jump_mean
+        self.jump_std = jump_std
+
+    def log_returns(self, rng, shocks):
+        returns = super().log_returns(rng, shocks)
+        jumps = rng.poisson(self.jump_intensity, size=shocks.shape)
+        hit = jumps > 0
+        # The sum of n normal jumps is normal with mean n*mu and std sqrt(n)*sigma
+        returns[hit] += (jumps[hit] * self.jump_mean
+                         + np.sqrt(jumps[hit]) * self.jump_std * rng.standard_normal(hit.sum()))
+        return returns
+
+
+class MeanRevertingModel(PriceModel):
+    """Ornstein-Uhlenbeck process on log price, pulled towards ``mean_price``."""
+
+    def __init__(self, mean_price: float = 50000.0, speed: float = 0.01,
+                 volatility: float = 0.001):
+        if not 0 < speed < 1:
+            raise ValueError("Mean reversion speed must be between 0 and 1")
+        self.mean_price = mean_price
+        self.speed = speed
+        self.volatility = volatility
+
+    def generate(self, rng, shocks, start_prices):
+        phi = 1.0 - self.speed
+        # Solve the AR(1) recursion in chunks short enough that phi**-n stays finite
+        chunk = max(1, int(12 / -np.log(phi)))
+        target = np.log(self.mean_price)
+        deviation = np.log(start_prices) - target
+        out = np.empty_like(shocks)
+
+        for start in range(0, len(shocks), chunk):
+            noise = self.volatility * shocks[start:start + chunk]
+            steps = np.arange(1, len(noise) + 1)[:, None]
+            decay = phi ** steps
+            path = decay * (deviation + np.cumsum(noise / decay, axis=0))
+            out[start:start + chunk] = path
+            deviation = path[-1]
+
+        return np.exp(target + out)
+
+
+class RegimeSwitchingModel(PriceModel):
+    """GBM whose drift and volatility follow a Markov chain of market regimes.
+
+    The regime is shared by all symbols. Dwell times are drawn geometrically,
+    so the cost is per regime change rather than per tick.
+    """
+
+    def __init__(self, regimes: Optional[List[Dict]] = None,
+                 transition: Optional[Sequence[Sequence[float]]] = None):
+        self.regimes = regimes or [
+            {'drift': 0.0, 'volatility': 0.0005},
+            {'drift': 0.0, 'volatility': 0.003}
+        ]
+        n = len(self.regimes)
+        if transition is None:
+            transition = np.full((n, n), 0.001 / max(1, n - 1))
+            np.fill_diagonal(transition, 0.999)
+        self.transition = np.asarray(transition, dtype=float)
+        if self.transition.shape != (n, n):
+            raise ValueError("Transition matrix must be square with one row per regime")
+        self.drift = np.array([r.get('drift', 0.0) for r in self.regimes])
+        self.volatility = np.array([r['volatility'] for r in self.regimes])
+        self.regime = 0
+
+    def reset(self):
+        self.regime = 0
+
+    def _regime_path(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Draw the regime index for each of the next ``n`` ticks."""
+        path = np.empty(n, dtype=np.intp)
+        pos = 0
+        while pos < n:
+            stay = self.transition[self.regime, self.regime]
+            dwell = n - pos if stay >= 1.0 else int(rng.geometric(1.0 - stay))
+            path[pos:pos + dwell] = self.regime
+            pos += dwell
+            if pos > n:
+                # Dwell times are memoryless, so the remainder is redrawn next block
+                break
+            leave = self.transition[self.regime].copy()
+            leave[self.regime] = 0.0
+            if leave.sum() > 0:
+                self.regime = int(rng.choice(len(leave), p=leave / leave.sum()))
+        return path
+
+    def generate(self, rng, shocks, start_prices):
+        regimes = self._regime_path(rng, len(shocks))
+        drift = self.drift[regimes][:, None]
+        volatility = self.volatility[regimes][:, None]
+        returns = (drift - 0.5 * volatility ** 2) + volatility * shocks
+        return start_prices * np.exp(np.cumsum(returns, axis=0))
+
+
+class HistoricalReplayModel(PriceModel):
+    """Replay recorded prices (one column per symbol), looping at the end."""
+
+    def __init__(self, prices: Optional[np.ndarray] = None, path: Optional[str] = None,
+                 symbols: Optional[Sequence[str]] = None):
+        if prices is None:
+            if path is None:
+                raise ValueError("Historical replay needs prices or a CSV path")
+            prices = self.load_csv(path, symbols)
+        prices = np.asarray(prices, dtype=float)
+        self.prices = prices.reshape(len(prices), -1)
+        self.position = 0
+
+    @staticmethod
+    def load_csv(path: str, symbols: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Load a CSV with a header row of symbol names."""
+        data = np.genfromtxt(path, delimiter=',', names=True, deletechars='')
+        columns = list(symbols) if symbols else list(data.dtype.names)
+        return np.column_stack([data[name] for name in columns])
+
+    def reset(self):
+        self.position = 0
+
+    def generate(self, rng, shocks, start_prices):
+        n = len(shocks)
+        index = (self.position + np.arange(n)) % len(self.prices)
+        self.position = (self.position + n) % len(self.prices)
+        return self.prices[index][:, :shocks.shape[1]]
+
+
+MODELS = {
+    'gbm': GBMModel,
+    'jump_diffusion': JumpDiffusionModel,
+    'mean_reverting': MeanRevertingModel,
+    'regime_switching': RegimeSwitchingModel,
+    'historical': HistoricalReplayModel
+}
+
+
+class MarketSimulator:
+    """Seedable multi-symbol price generator.
+
+    Prices are produced in pre-computed blocks, so stepping one tick at a time
+    is an array lookup and ``generate()`` can produce millions of ticks in a
+    single vectorized call. Two simulators with the same seed and settings
+    produce identical paths.
+    """
+
+    def __init__(self, symbols: Sequence[str], model: Optional[PriceModel] = None,
+                 seed: Optional[int] = None, initial_prices: Optional[Dict[str, float]] = None,
+                 correlation: Optional[Sequence[Sequence[float]]] = None,
+                 block_size: int = 4096):
+        self.symbols = list(symbols)
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.model = model or GBMModel()
+        self.seed = seed
+        self.block_size = block_size
+
+        initial_prices = initial_prices or {}
+        self.initial_prices = np.array(
+            [float(initial_prices.get(symbol, 50000.0)) for symbol in self.symbols]
+        )
+        if isinstance(self.model, HistoricalReplayModel):
+            columns = self.model.prices.shape[1]
+            if columns < len(self.symbols):
+                raise ValueError(f"Historical prices have {columns} columns for {len(self.symbols)} symbols")
+            # A replay starts from its first recorded prices
+            self.initial_prices = self.model.prices[0, :len(self.symbols)].copy()
+
+        self._cholesky = None
+        if correlation is not None:
+            correlation = np.asarray(correlation, dtype=float)
+            if correlation.shape != (len(self.symbols), len(self.symbols)):
+                raise ValueError("Correlation matrix must match the number of symbols")
+            self._cholesky = np.linalg.cholesky(correlation)
+
+        self.reset(seed)
+
+    @classmethod
+    def from_config(cls, config: Dict, symbols: Sequence[str]) -> 'MarketSimulator':
+        """Build a simulator from the ``paper_trading.simulation`` config section."""
+        paper_config = config.get('paper_trading')
+        sim_config = paper_config.get('simulation', {}) if isinstance(paper_config, dict) else {}
+        model_name = sim_config.get('model', 'gbm')
+        if model_name not in MODELS:
+            raise ValueError(f"Unknown simulation model: {model_name}")
+        params = dict(sim_config.get('params', {}))
+        if model_name == 'historical':
+            params.setdefault('symbols', symbols)
+
+        return cls(
+            symbols=symbols,
+            model=MODELS[model_name](**params),
+            seed=sim_config.get('seed'),
+            initial_prices=sim_config.get('initial_prices'),
+            correlation=sim_config.get('correlation'),
+            block_size=sim_config.get('block_size', 4096)
+        )
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Restart the price paths from the initial prices."""
+        if seed is not None:
+            self.seed = seed
+        self.rng = np.random.default_rng(self.seed)
+        self.model.reset()
+        self.last_prices = self.initial_prices.copy()
+        self._block = np.empty((0, len(self.symbols)))
+        self._cursor = 0
+
+    def generate(self, n: int) -> np.ndarray:
+        """Generate the next ``n`` ticks for every symbol as an (n, symbols) array."""
+        shocks = self.rng.standard_normal((n, len(self.symbols)))
+        if self._cholesky is not None:
+            shocks = shocks @ self._cholesky.T
+        prices = self.model.generate(self.rng, shocks, self.last_prices)
+        if n:
+            self.last_prices = prices[-1].copy()
+        return prices
+
+    def step(self) -> np.ndarray:
+        """Advance one tick and return the prices of all symbols."""
+        if self._cursor >= len(self._block):
+            self._block = self.generate(self.block_size)
+            self._cursor = 0
+        row = self._block[self._cursor]
+        self._cursor += 1
+        return row
+
+    def next_price(self, symbol: str) -> float:
+        """Advance one tick and return the price of ``symbol``."""
+        if symbol not in self.index:
+            raise ValueError(f"Unknown symbol for simulation: {symbol}")
+        return float(self.step()[self.index[symbol]])
@@ -0,0 +1,357 @@
+import asyncio
+import json
+import multiprocessing
+import signal
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from . import ipc
+from .blotter import FIELDS as BLOTTER_FIELDS, TradeBlotter
+from .clock import get_clock
+from .exchange import encoding
+from .exchange.recording import read_ticks
+from .exchange.registry import create_exchange, exchange_name
+from .logger import logger
+from .price_history import PriceHistory
+from .trading_bot import TradingBot, load_config
+
+
+def _load_config(role: str) -> Dict:
+    """Load the config, giving this process a capture file of its own.
+
+    Each process records to and replays from ``<capture path>.<role>``, so a
+    capture file never has more than one writer.
+    """
+    config = load_config()
+    capture_config = config.get('exchange', {}).get('capture')
+    if capture_config and capture_config.get('path'):
+        capture_config['path'] = f"{capture_config['path']}.{role}"
+    return config
+
+
+class StrategyServer:
+    """Owns the TradingBot in the strategy process.
+
+    Market ticks and control requests arrive over a Unix socket. Subscribers
+    get a snapshot of the blotter and price history, then every tick and
+    recorded trade, plus a status snapshot serialized once per interval.
+    Dashboard reads are served from those copies in the web process, so they
+    never run on this process's event loop.
+    """
+
+    def __init__(self, socket_path: str, status_interval: float = 1.0):
+        self.socket_path = Path(socket_path)
+        self.status_interval = status_interval
+        self.subscribers = set()
+        self.bot = self._create_bot()
+        self.methods: Dict[str, Callable] = {
+            'start': self._start,
+            'stop': self._stop,
+            'config': self._config
+        }
+
+    async def serve(self) -> None:
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path))
+        logger.info(f"Strategy process listening on {self.socket_path}")
+        publisher = asyncio.create_task(self._publish_status())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            publisher.cancel()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                msg_type, payload = await ipc.read_message(reader)
+                if msg_type == ipc.MSG_TICK:
+                    if not self.bot.poll_market:
+                        symbol, _, price = ipc.unpack_tick(payload)
+                        self.bot.on_tick(symbol, price)
+                elif msg_type == ipc.MSG_REQUEST:
+                    asyncio.create_task(self._dispatch(encoding.loads(payload), writer))
+                elif msg_type == ipc.MSG_SUBSCRIBE:
+                    # No await between the snapshot and subscribing, so the
+                    # subscriber sees every later tick and trade exactly once
+                    writer.write(self._snapshot())
+                    self.subscribers.add(writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.subscribers.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, request: Dict, writer: asyncio.StreamWriter) -> None:
+        """Run a requested method and send back its result or error."""
+        reply = {'id': request.get('id')}
+        method = self.methods.get(request.get('method'))
+        try:
+            if method is None:
+                raise ValueError(f"Unknown method: {request.get('method')}")
+            reply['result'] = await method(**request.get('params', {}))
+        except Exception as e:
+            logger.error(f"Error handling {request.get('method')} request: {str(e)}")
+            reply['error'] = str(e)
+        if not writer.is_closing():
+            writer.write(ipc.pack_json(ipc.MSG_REPLY, reply))
+
+    def _create_bot(self) -> TradingBot:
+        """Build the bot; in paper mode it polls its own simulated exchange.
+
+        The paper exchange's simulator prices fills and positions, so it must
+        also be the source of the ticks behind analytics and the chart.
+        """
+        config = _load_config('strategy')
+        bot = TradingBot(poll_market=exchange_name(config) == 'paper', config=config)
+        bot.tick_listeners.append(self._publish_tick)
+        bot.trade_listeners.append(self._publish_trade)
+        return bot
+
+    def _snapshot(self) -> bytes:
+        return ipc.pack_json(ipc.MSG_SNAPSHOT, {
+            'capacity': self.bot.blotter.capacity,
+            'blotter': self.bot.blotter.columns(),
+            'levels': self.bot.history.levels,
+            'history': self.bot.history.export()
+        })
+
+    def _broadcast(self, frame: bytes) -> None:
+        for writer in list(self.subscribers):
+            if not writer.is_closing():
+                writer.write(frame)
+
+    def _publish_tick(self, symbol: str, timestamp: float, price: float) -> None:
+        if self.subscribers:
+            self._broadcast(ipc.pack_tick(symbol, timestamp, price))
+
+    def _publish_trade(self, row: Dict) -> None:
+        if self.subscribers:
+            self._broadcast(ipc.pack_json(ipc.MSG_TRADE, row))
+
+    async def _publish_status(self) -> None:
+        while True:
+            if self.subscribers:
+                self._broadcast(ipc.pack_json(ipc.MSG_STATUS, await self.bot.get_status()))
+            await asyncio.sleep(self.status_interval)
+
+    async def _start(self) -> Dict:
+        if self.bot.is_running:
+            return {"status": "error", "message": "Bot is already running"}
+        await self.bot.start()
+        return {"status": "success", "message": "Bot started"}
+
+    async def _stop(self) -> Dict:
+        if not self.bot.is_running:
+            return {"status": "error", "message": "Bot is not running"}
+        await self.bot.stop()
+        return {"status": "success", "message": "Bot stopped"}
+
+    async def _config(self, data: Dict) -> Dict:
+        with open(Path('config/config.json'), 'w') as f:
+            json.dump(data, f, indent=2)
+
+        was_running = self.bot.is_running
+        if was_running:
+            await self.bot.stop()
+        self.bot = self._create_bot()
+        # The new bot starts with an empty blotter and history
+        if self.subscribers:
+            self._broadcast(self._snapshot())
+        if was_running:
+            await self.bot.start()
+        return {"status": "success", "message": "Configuration updated"}
+
+
+class DashboardReplica:
+    """The web process's copy of the strategy process's blotter and price history.
+
+    Rebuilt from each snapshot the strategy process sends, then kept current
+    from the ticks and trades it streams.
+    """
+
+    def __init__(self):
+        self.blotter: Optional[TradeBlotter] = None
+        self.history: Optional[PriceHistory] = None
+
+    @property
+    def handlers(self) -> Dict[int, Callable[[bytes], None]]:
+        """IPCClient handlers that keep the replica up to date."""
+        return {
+            ipc.MSG_SNAPSHOT: self._on_snapshot,
+            ipc.MSG_TICK: self._on_tick,
+            ipc.MSG_TRADE: self._on_trade
+        }
+
+    def _on_snapshot(self, payload: bytes) -> None:
+        data = encoding.loads(payload)
+        blotter = TradeBlotter(capacity=data['capacity'])
+        columns = data['blotter']
+        for values in zip(*(columns[field] for field in BLOTTER_FIELDS)):
+            blotter.append(dict(zip(BLOTTER_FIELDS, values)))
+        history = PriceHistory(data['levels'])
+        history.load(data['history'])
+        self.blotter, self.history = blotter, history
+
+    def _on_tick(self, payload: bytes) -> None:
+        if self.history is not None:
+            self.history.add(*ipc.unpack_tick(payload))
+
+    def _on_trade(self, payload: bytes) -> None:
+        if self.blotter is not None:
+            self.blotter.append(encoding.loads(payload))
+
+
+async def _replay_market_data(client: ipc.IPCClient, capture_config: Dict) -> None:
+    """Forward recorded ticks with their original spacing divided by ``speed``."""
+    speed = capture_config.get('speed', 1.0)
+    while True:
+        previous = None
+        for symbol, timestamp, price in read_ticks(capture_config['path']):
+            if speed and previous is not None and timestamp > previous:
+                await asyncio.sleep((timestamp - previous) / speed)
+            previous = timestamp
+            await client.send(ipc.pack_tick(symbol, get_clock().time(), price))
+        if not capture_config.get('loop', False):
+            logger.info("Market data replay finished")
+            return
+
+
+async def _stream_market_data(socket_path: str) -> None:
+    """Poll the exchange and forward each price to the strategy process.
+
+    With ``exchange.capture.mode`` set to ``record`` every tick is also
+    appended to the capture file; with ``replay`` the recorded ticks are
+    streamed instead of polling.
+    """
+    config = _load_config('market_data')
+    if exchange_name(config) == 'paper':
+        # The strategy process polls its own simulator; a second one here
+        # would follow a different price path
+        logger.info("Paper trading: market data comes from the strategy process")
+        await asyncio.Event().wait()
+    capture_config = config.get('exchange', {}).get('capture', {})
+    symbol = config.get('trading_pair', 'BTC-USDT')
+    interval = config.get('poll_interval', 1.0)
+
+    client = ipc.IPCClient(socket_path)
+    await client.start()
+    if capture_config.get('mode') == 'replay':
+        logger.info(f"Market data process replaying {capture_config['path']}")
+        await _replay_market_data(client, capture_config)
+        # Stay up so the supervisor does not restart a finished replay
+        await asyncio.Event().wait()
+
+    exchange = create_exchange(config)
+    await exchange.connect()
+    # Ticks share the recording exchange's writer, so the file has one writer
+    capture = exchange.capture if capture_config.get('mode') == 'record' else None
+    logger.info(f"Market data process streaming {symbol}")
+
+    while True:
+        try:
+            price = await exchange.get_market_price(symbol)
+            timestamp = get_clock().time()
+            await client.send(ipc.pack_tick(symbol, timestamp, price))
+            if capture is not None:
+                capture.write_tick(symbol, timestamp, price)
+        except Exception as e:
+            logger.error(f"Error streaming market data: {str(e)}")
+        await asyncio.sleep(interval)
+
+
+def _ignore_sigint() -> None:
+    # Ctrl-C reaches the whole process group; let the supervisor shut workers down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def run_strategy(socket_path: str, status_interval: float = 1.0) -> None:
+    """Entry point of the strategy/execution process."""
+    _ignore_sigint()
+    asyncio.run(StrategyServer(socket_path, status_interval).serve())
+
+
+def run_market_data(socket_path: str) -> None:
+    """Entry point of the market data process."""
+    _ignore_sigint()
+    asyncio.run(_stream_market_data(socket_path))
+
+
+class Supervisor:
+    """Starts worker processes and restarts any that exit.
+
+    Restarts back off exponentially, and the supervisor gives up on a worker
+    that crashes more than ``max_restarts`` times within ``restart_window``.
+    """
+
+    def __init__(self, max_restarts: int = 5, restart_window: float = 60.0,
+                 backoff: float = 0.5, max_backoff: float = 30.0):
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.workers: Dict[str, tuple] = {}
+        self.processes: Dict[str, multiprocessing.Process] = {}
+        self._crashes: Dict[str, deque] = {}
+        self._restart_at: Dict[str, float] = {}
+
+    def add(self, name: str, target: Callable, *args) -> None:
+        """Register a worker; workers start in the order they were added."""
+        self.workers[name] = (target, args)
+        self._crashes[name] = deque()
+
+    def _spawn(self, name: str) -> None:
+        target, args = self.workers[name]
+        process = multiprocessing.Process(target=target, args=args, name=name, daemon=True)
+        process.start()
+        self.processes[name] = process
+        logger.info(f"Started {name} worker (pid {process.pid})")
+
+    def _check(self, name: str, now: float) -> None:
+        """Schedule a restart for a worker that has exited."""
+        process = self.processes[name]
+        if process.is_alive() or name in self._restart_at:
+            return
+
+        crashes = self._crashes[name]
+        while crashes and now - crashes[0] > self.restart_window:
+            crashes.popleft()
+        crashes.append(now)
+        if len(crashes) > self.max_restarts:
+            raise RuntimeError(f"Worker {name} crashed {len(crashes)} times in {self.restart_window}s")
+
+        delay = min(self.backoff * 2 ** (len(crashes) - 1), self.max_backoff)
+        logger.error(f"Worker {name} exited with code {process.exitcode}, restarting in {delay:.1f}s")
+        self._restart_at[name] = now + delay
+
+    def run(self, poll_interval: float = 0.2) -> None:
+        """Start all workers and supervise them until interrupted."""
+        for name in self.workers:
+            self._spawn(name)
+        try:
+            while True:
+                time.sleep(poll_interval)
+                now = time.monotonic()
+                for name in self.workers:
+                    self._check(name, now)
+                for name, restart_at in list(self._restart_at.items()):
+                    if now >= restart_at:
+                        del self._restart_at[name]
+                        self._spawn(name)
+        except KeyboardInterrupt:
+            logger.info("Shutting down workers")
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Terminate all workers."""
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes.values():
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
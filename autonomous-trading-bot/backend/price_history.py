@@ -0,0 +1,240 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# (bucket seconds, capacity): raw ticks for a day at 1 Hz, then 10 s bars for
+# a day, 1 min bars for a week and 15 min bars for a year
+DEFAULT_LEVELS = ((0, 86400), (10, 8640), (60, 10080), (900, 35040))
+
+
+class _Level:
+    """Ring buffer of time, low, high and close columns at one resolution."""
+
+    def __init__(self, resolution: float, capacity: int):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.time = np.zeros(capacity)
+        self.low = np.zeros(capacity)
+        self.high = np.zeros(capacity)
+        self.close = np.zeros(capacity)
+        self.size = 0
+        self.next = 0
+
+    @property
+    def last_slot(self) -> int:
+        return (self.next - 1) % self.capacity
+
+    @property
+    def oldest_time(self) -> Optional[float]:
+        if not self.size:
+            return None
+        return self.time[(self.next - self.size) % self.capacity]
+
+    def load(self, time: Sequence[float], low: Sequence[float], high: Sequence[float],
+             close: Sequence[float]) -> None:
+        """Replace the contents with bars in the form returned by ``window()``."""
+        n = min(len(time), self.capacity)
+        for column, values in ((self.time, time), (self.low, low), (self.high, high),
+                               (self.close, close)):
+            column[:n] = values[len(values) - n:]
+        self.size = n
+        self.next = n % self.capacity
+
+    def latest_time(self, end: float) -> Optional[float]:
+        """Time of the newest entry at or before ``end``."""
+        if not self.size:
+            return None
+        newest = self.time[self.last_slot]
+        if newest <= end:
+            return float(newest)
+        times = self.window(-np.inf, end)[0]
+        return float(times[-1]) if len(times) else None
+
+    def add(self, timestamp: float, price: float) -> None:
+        """Append a tick, or fold it into the current bar at coarser resolutions."""
+        if self.resolution:
+            bucket = timestamp - timestamp % self.resolution
+            slot = self.last_slot
+            if self.size and self.time[slot] == bucket:
+                self.low[slot] = min(self.low[slot], price)
+                self.high[slot] = max(self.high[slot], price)
+                self.close[slot] = price
+                return
+            timestamp = bucket
+
+        slot = self.next
+        self.time[slot] = timestamp
+        self.low[slot] = self.high[slot] = self.close[slot] = price
+        self.next = (slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def window(self, start: float, end: float, inclusive_start: bool = True) -> Tuple[np.ndarray, ...]:
+        """Return (time, low, high, close) for bars in the window, oldest first."""
+        first = (self.next - self.size) % self.capacity
+        if first + self.size <= self.capacity:
+            segments = [(first, first + self.size)]
+        else:
+            segments = [(first, self.capacity), (0, first + self.size - self.capacity)]
+
+        side = 'left' if inclusive_start else 'right'
+        parts = []
+        for lo, hi in segments:
+            times = self.time[lo:hi]
+            a = lo + np.searchsorted(times, start, side)
+            b = lo + np.searchsorted(times, end, 'right')
+            if a < b:
+                parts.append(slice(a, b))
+
+        columns = (self.time, self.low, self.high, self.close)
+        if not parts:
+            return tuple(column[:0] for column in columns)
+        if len(parts) == 1:
+            return tuple(column[parts[0]] for column in columns)
+        return tuple(np.concatenate([column[part] for part in parts]) for column in columns)
+
+
+def lttb(times: np.ndarray, values: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of ``threshold`` representative points."""
+    n = len(times)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third vertex
+        next_lo, next_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_t = times[next_lo:next_hi].mean()
+        avg_v = values[next_lo:next_hi].mean()
+        t, v = times[lo:hi], values[lo:hi]
+        area = np.abs((times[previous] - avg_t) * (v - values[previous])
+                      - (times[previous] - t) * (avg_v - values[previous]))
+        previous = lo + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def minmax(times: np.ndarray, low: np.ndarray, high: np.ndarray,
+           threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the low and the high of each of ``threshold // 2`` buckets, in time order."""
+    n = len(times)
+    buckets = max(1, threshold // 2)
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+    out_t: List[float] = []
+    out_v: List[float] = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        if lo == hi:
+            continue
+        i = lo + int(np.argmin(low[lo:hi]))
+        j = lo + int(np.argmax(high[lo:hi]))
+        for k, value in sorted(((i, low[i]), (j, high[j]))):
+            out_t.append(times[k])
+            out_v.append(value)
+    return np.array(out_t), np.array(out_v)
+
+
+class PriceHistory:
+    """Per-symbol price history kept at several resolutions.
+
+    Every tick updates each resolution in O(1). Queries read the finest
+    resolution that still covers the requested window without far more
+    points than the chart can draw, then downsample to ``width`` points.
+    """
+
+    def __init__(self, levels: Sequence[Sequence[float]] = DEFAULT_LEVELS,
+                 oversample: int = 8):
+        self.levels = [tuple(level) for level in sorted(levels)]
+        self.oversample = oversample
+        self._symbols: Dict[str, List[_Level]] = {}
+
+    def add(self, symbol: str, timestamp: float, price: float) -> None:
+        """Record a tick."""
+        levels = self._symbols.get(symbol)
+        if levels is None:
+            levels = [_Level(resolution, int(capacity)) for resolution, capacity in self.levels]
+            self._symbols[symbol] = levels
+        for level in levels:
+            level.add(timestamp, price)
+
+    def export(self) -> Dict[str, List[List[List[float]]]]:
+        """Every level of every symbol as (time, low, high, close) lists, for ``load()``."""
+        return {
+            symbol: [[column.tolist() for column in level.window(-np.inf, np.inf)] for level in levels]
+            for symbol, levels in self._symbols.items()
+        }
+
+    def load(self, data: Dict[str, List[List[List[float]]]]) -> None:
+        """Replace all history with the output of ``export()`` from the same levels."""
+        self._symbols = {}
+        for symbol, columns in data.items():
+            levels = [_Level(resolution, int(capacity)) for resolution, capacity in self.levels]
+            for level, level_columns in zip(levels, columns):
+                level.load(*level_columns)
+            self._symbols[symbol] = levels
+
+    def _select_level(self, levels: List[_Level], start: float, end: float,
+                      width: int) -> _Level:
+        for level in levels:
+            oldest = level.oldest_time
+            if oldest is None:
+                continue
+            # A level that has started evicting must reach back to ``start``
+            if oldest > start and level.size == level.capacity:
+                continue
+            if level.resolution and (end - start) / level.resolution > width * self.oversample:
+                continue
+            if not level.resolution:
+                # Raw ticks are irregular, so count rather than estimate
+                if len(level.window(start, end)[0]) > width * self.oversample:
+                    continue
+            return level
+        # Nothing both covers the window and is sparse enough: use the longest span
+        return levels[-1]
+
+    def query(self, symbol: str, start: float, end: float, width: int = 500,
+              since: Optional[float] = None, method: str = 'lttb') -> Dict:
+        """Return at most ``width`` points of ``symbol`` between ``start`` and ``end``.
+
+        With ``since`` only points newer than that timestamp are returned, read
+        from the finest resolution, for incremental chart updates. ``last`` is
+        the newest tick in the window, whatever resolution was read, and is
+        the ``since`` to pass next time.
+        """
+        if method not in ('lttb', 'minmax'):
+            raise ValueError(f"Unknown downsampling method: {method}")
+        width = max(3, width)
+        levels = self._symbols.get(symbol)
+        if not levels:
+            return {'symbol': symbol, 'resolution': None, 'points': [], 'last': since}
+
+        if since is not None:
+            level = levels[0]
+            times, low, high, close = level.window(since, end, inclusive_start=False)
+        else:
+            level = self._select_level(levels, start, end, width)
+            times, low, high, close = level.window(start, end)
+
+        # Bars are stamped with their start time, and minmax may end on an
+        # earlier point, so take the cursor from the finest resolution
+        latest = levels[0].latest_time(end)
+        lower = start if since is None else since
+        last = latest if latest is not None and latest > lower else since
+
+        values = close
+        if len(times) > width:
+            if method == 'minmax':
+                times, values = minmax(times, low, high, width)
+            else:
+                index = lttb(times, close, width)
+                times, values = times[index], close[index]
+
+        return {
+            'symbol': symbol,
+            'resolution': level.resolution,
+            'points': np.column_stack((times, values)).tolist(),
+            'last': last
+        }
@@ -6,64 +6,99 @@ import random
 from collections import namedtuple
 
 from .logger import logger
-from .exchange.paper_trade import PaperTradingExchange
-from .exchange.delta import DeltaExchange
+from .clock import get_clock
+from .blotter import TradeBlotter
+from .analytics import PortfolioAnalytics
+from .price_history import DEFAULT_LEVELS, PriceHistory
+from .exchange.base import OrderRequest, Position
+from .exchange.registry import create_exchange, exchange_name
+
+def load_config():
+    """Load configuration from config.json."""
+    try:
+        config_path = Path('config/config.json')
+        with open(config_path) as f:
+            config = json.load(f)
+        
+        # Add default risk management settings if not present
+        if 'risk_management' not in config:
+            config['risk_management'] = {
+                'position_size': {'max_trade_size': 1.0},
+                'stop_loss': {
+                    'type': 'trailing',
+                    'activation_percent': 1.0,
+                    'trail_percent': 0.5
+                }
+            }
+        
+        return config
+    except Exception as e:
+        logger.error(f"Error loading config: {str(e)}")
+        # Return default config
+        return {
+            'trading_mode': 'paper',
+            'trading_pair': 'BTC-USDT',
+            'order_size': 0.01,
+            'risk_management': {
+                'position_size': {'max_trade_size': 1.0},
+                'stop_loss': {
+                    'type': 'trailing',
+                    'activation_percent': 1.0,
+                    'trail_percent': 0.5
+                }
+            }
+        }
 
 class TradingBot:
-    def __init__(self):
-        """Initialize the trading bot."""
-        self.config = self._load_config()
+    def __init__(self, poll_market: bool = True, config=None):
+        """Initialize the trading bot.
+        
+        With ``poll_market`` False the bot does not poll prices itself and
+        expects ticks to be delivered through ``on_tick()``. ``config`` is
+        used instead of reading config.json when given.
+        """
+        self.config = config if config is not None else self._load_config()
+        self.poll_market = poll_market
         self.is_running = False
         self.last_trade = None
         
-        # Initialize exchange
-        if self.config.get('paper_trading', True):
-            self.exchange = PaperTradingExchange(config=self.config)
-            logger.info("Initializing paper trading exchange")
-        else:
-            self.exchange = DeltaExchange(
-                api_key=self.config['api_key'],
-                api_secret=self.config['api_secret'],
-                config=self.config
-            )
-            logger.info("Initializing live trading exchange")
+        # Bounded history of orders and fills
+        blotter_config = self.config.get('blotter', {})
+        self.blotter = TradeBlotter(
+            capacity=blotter_config.get('capacity', 10000),
+            spill_path=blotter_config.get('spill_path')
+        )
+        
+        # Incremental PnL and risk figures, fed by fills and market ticks
+        paper_config = self.config.get('paper_trading')
+        if not isinstance(paper_config, dict):
+            paper_config = {}
+        analytics_config = self.config.get('analytics', {})
+        self.fee_percent = self.config.get('fees', {}).get('taker_percent', 0.0)
+        self.analytics = PortfolioAnalytics(
+            initial_equity=paper_config.get('initial_balance', 10000),
+            window=analytics_config.get('window', 500),
+            periods_per_year=analytics_config.get('periods_per_year')
+        )
+        self._market_task = None
+        
+        # Multi-resolution price history for the dashboard chart
+        self.history = PriceHistory(self.config.get('history', {}).get('levels', DEFAULT_LEVELS))
+        
+        # Called with (symbol, timestamp, price) for each tick and with the
+        # blotter row of each recorded order, to mirror them elsewhere
+        self.tick_listeners = []
+        self.trade_listeners = []
+        
+        # Initialize exchange; backends are imported on first use
+        self.mode = 'paper' if exchange_name(self.config) == 'paper' else 'live'
+        self.exchange = create_exchange(self.config)
+        logger.info(f"Initializing {self.mode} trading exchange ({type(self.exchange).__name__})")
             
     def _load_config(self):
         """Load configuration from config.json."""
-        try:
-            config_path = Path('config/config.json')
-            with open(config_path) as f:
-                config = json.load(f)
-            
-            # Add default risk management settings if not present
-            if 'risk_management' not in config:
-                config['risk_management'] = {
-                    'position_size': {'max_trade_size': 1.0},
-                    'stop_loss': {
-                        'type': 'trailing',
-                        'activation_percent': 1.0,
-                        'trail_percent': 0.5
-                    }
-                }
-            
-            return config
-        except Exception as e:
-            logger.error(f"Error loading config: {str(e)}")
-            # Return default config
-            return {
-                'paper_trading': True,
-                'trading_pair': 'BTC-USDT',
-                'order_size': 0.01,
-                'risk_management': {
-                    'position_size': {'max_trade_size': 1.0},
-                    'stop_loss': {
-                        'type': 'trailing',
-                        'activation_percent': 1.0,
-                        'trail_percent': 0.5
-                    }
-                }
-            }
-            
+        return load_config()
+        
     async def start(self):
         """Start the trading bot."""
         if self.is_running:
@@ -74,7 +109,14 @@ class TradingBot:
             await self.exchange.connect()
             logger.info("Paper trading exchange connected")
             
+            # Measure performance from the equity we start trading with
+            if self.analytics.fills == 0:
+                balances = await self.exchange.get_balance()
+                self.analytics.reset(float(balances.get('total', balances.get('USDT', 0))))
+            
             self.is_running = True
+            if self.poll_market:
+                self._market_task = asyncio.create_task(self._market_loop())
             logger.info("Trading bot started")
             
             # Execute initial trade
@@ -90,6 +132,11 @@ class TradingBot:
             return
             
         self.is_running = False
+        if self._market_task is not None:
+            self._market_task.cancel()
+            self._market_task = None
+        await self.exchange.close()
+        self.blotter.close()
         logger.info("Trading bot stopped")
         
     async def get_status(self):
@@ -98,31 +145,18 @@ class TradingBot:
             balances = await self.exchange.get_balance()
             positions = await self.exchange.get_positions()
             
-            # Calculate total PnL
-            total_pnl = 0
-            for position in positions:
-                if isinstance(position, dict) and 'pnl' in position:
-                    total_pnl += float(position['pnl'])
-            
             return {
                 'is_running': self.is_running,
-                'mode': 'paper' if isinstance(self.exchange, PaperTradingExchange) else 'live',
+                'mode': self.mode,
                 'status': 'running' if self.is_running else 'stopped',
                 'balances': {
                     'USDT': round(float(balances.get('USDT', 0)), 2),
                     'BTC': round(float(balances.get('BTC', 0)), 8),
                     'total': round(float(balances.get('total', 0)), 2)
                 },
-                'positions': [
-                    {
-                        'symbol': p['symbol'],
-                        'quantity': round(float(p['quantity']), 8),
-                        'entry_price': round(float(p['entry_price']), 2),
-                        'current_price': round(float(p['current_price']), 2),
-                        'pnl': round(float(p['pnl']), 2)
-                    } for p in positions
-                ],
-                'total_pnl': round(total_pnl, 2),
+                'positions': [self._position_status(p) for p in positions],
+                'total_pnl': round(self.analytics.total_pnl, 2),
+                'analytics': self.analytics.snapshot(),
                 'last_trade': {
                     'order_id': self.last_trade.order_id,
                     'symbol': self.last_trade.symbol,
@@ -137,15 +171,35 @@ class TradingBot:
             logger.error(f"Error getting status: {str(e)}")
             return {
                 'is_running': self.is_running,
-                'mode': 'paper' if isinstance(self.exchange, PaperTradingExchange) else 'live',
+                'mode': self.mode,
                 'status': 'running' if self.is_running else 'stopped',
                 'balances': {'USDT': 0.00, 'BTC': 0.00000000, 'total': 0.00},
                 'positions': [],
                 'total_pnl': 0.00,
+                'analytics': self.analytics.snapshot(),
                 'last_trade': None,
                 'error': str(e)
             }
         
+    @staticmethod
+    def _position_status(position):
+        """Status entry for a paper position dict or a live ``Position``."""
+        if isinstance(position, Position):
+            position = {
+                'symbol': position.symbol,
+                'quantity': position.quantity,
+                'entry_price': position.entry_price,
+                'current_price': position.current_price,
+                'pnl': position.unrealized_pnl
+            }
+        return {
+            'symbol': position['symbol'],
+            'quantity': round(float(position['quantity']), 8),
+            'entry_price': round(float(position['entry_price']), 2),
+            'current_price': round(float(position['current_price']), 2),
+            'pnl': round(float(position['pnl']), 2)
+        }
+        
     async def _execute_trade(self):
         """Execute a trade based on strategy."""
         try:
@@ -153,14 +207,45 @@ class TradingBot:
             symbol = self.config.get('trading_pair', 'BTC-USDT')
             quantity = self.config.get('order_size', 0.01)
             
-            self.last_trade = await self.exchange.place_order(
+            self.last_trade = await self.exchange.place_order(OrderRequest(
                 symbol=symbol,
                 side='buy',
-                quantity=quantity
-            )
+                quantity=quantity,
+                order_type='market'
+            ))
+            self._record_fill(self.last_trade)
             
             logger.info(f"Entry order placed: {self.last_trade}")
             
         except Exception as e:
             logger.error(f"Error executing trade: {str(e)}")
             raise
+            
+    def _record_fill(self, order):
+        """Record an order in the blotter and, once filled, in the analytics."""
+        row = self.blotter.get(self.blotter.record(order))
+        for listener in self.trade_listeners:
+            listener(row)
+        if order.status == 'filled':
+            fee = order.price * order.quantity * self.fee_percent / 100
+            self.analytics.on_fill(order.symbol, order.side, order.quantity, order.price, fee)
+            
+    def on_tick(self, symbol: str, price: float):
+        """Handle a market price update."""
+        timestamp = get_clock().time()
+        self.history.add(symbol, timestamp, price)
+        self.analytics.on_tick(symbol, price)
+        for listener in self.tick_listeners:
+            listener(symbol, timestamp, price)
+        
+    async def _market_loop(self):
+        """Poll the market price of the trading pair while the bot is running."""
+        symbol = self.config.get('trading_pair', 'BTC-USDT')
+        interval = self.config.get('poll_interval', 1.0)
+        while self.is_running:
+            try:
+                price = await self.exchange.get_market_price(symbol)
+                self.on_tick(symbol, price)
+            except Exception as e:
+                logger.error(f"Error polling market price: {str(e)}")
+            await asyncio.sleep(interval)
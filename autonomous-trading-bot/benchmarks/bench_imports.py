@@ -0,0 +1,48 @@
+"""Cold-start cost of importing the bot and creating its exchange.
+
+Each scenario runs in a fresh interpreter and reports wall time and peak
+resident memory. Run from the project root with
+``python -m benchmarks.bench_imports``.
+"""
+import json
+import subprocess
+import sys
+
+RUNS = 5
+
+SCENARIOS = {
+    # What trading_bot.py used to import unconditionally
+    'eager (paper + delta)': (
+        "import backend.exchange.paper_trade, backend.exchange.delta\n"
+        "from backend.trading_bot import load_config\n"
+        "backend.exchange.paper_trade.PaperTradingExchange(load_config())"
+    ),
+    'registry (paper only)': (
+        "from backend.trading_bot import load_config\n"
+        "from backend.exchange.registry import create_exchange\n"
+        "create_exchange(load_config())"
+    )
+}
+
+PROBE = """
+import json, resource, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+def run(code):
+    """Run ``code`` in a fresh interpreter and return its timing report."""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(code=code)],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+if __name__ == '__main__':
+    for name, code in SCENARIOS.items():
+        results = [run(code) for _ in range(RUNS)]
+        seconds = min(r['seconds'] for r in results)
+        memory = min(r['maxrss_kb'] for r in results) / 1024
+        print(f"{name:<24} {seconds * 1000:8.1f} ms  {memory:8.1f} MiB peak RSS")
@@ -0,0 +1,34 @@
+"""Throughput of the vectorized market simulator.
+
+Run from the project root with ``python -m benchmarks.bench_market_sim``.
+"""
+import time
+
+from backend.market_sim import MODELS, HistoricalReplayModel, MarketSimulator
+
+TICKS = 1_000_000
+SYMBOLS = ['BTC-USDT', 'ETH-USDT']
+CORRELATION = [[1.0, 0.8], [0.8, 1.0]]
+
+def bench(name, simulator):
+    """Time one block of TICKS ticks for every symbol."""
+    start = time.perf_counter()
+    simulator.generate(TICKS)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<18} {elapsed * 1000:8.1f} ms  {TICKS * len(SYMBOLS) / elapsed:14,.0f} ticks/s")
+
+if __name__ == '__main__':
+    print(f"{TICKS:,} ticks x {len(SYMBOLS)} correlated symbols")
+    for name, model_class in MODELS.items():
+        if model_class is HistoricalReplayModel:
+            model = HistoricalReplayModel(prices=MarketSimulator(SYMBOLS, seed=1).generate(10000))
+        else:
+            model = model_class()
+        bench(name, MarketSimulator(SYMBOLS, model=model, seed=42, correlation=CORRELATION))
+
+    simulator = MarketSimulator(SYMBOLS, seed=42)
+    start = time.perf_counter()
+    for _ in range(100000):
+        simulator.next_price('BTC-USDT')
+    elapsed = time.perf_counter() - start
+    print(f"{'next_price':<18} {elapsed / 100000 * 1e6:8.3f} us/tick")
@@ -1,8 +1,17 @@
+import argparse
 import asyncio
+import csv
+import io
 import json
+import os
+import signal
+import tempfile
 from aiohttp import web
 from pathlib import Path
-from backend.trading_bot import TradingBot
+from backend.trading_bot import TradingBot, load_config
+from backend.blotter import FIELDS as BLOTTER_FIELDS
+from backend.ipc import IPCClient
+from backend.clock import get_clock
 from backend.logger import logger
 
 # Global variable declaration
@@ -84,14 +93,238 @@ async def update_config(request):
         logger.error(f"Error updating configuration: {str(e)}")
         return web.json_response({"status": "error", "message": str(e)}, status=500)
 
-def setup_routes(app):
-    """Setup web application routes."""
+def _query_float(request, name):
+    """Read an optional float query parameter."""
+    value = request.query.get(name)
+    return float(value) if value not in (None, '') else None
+
+def _query_int(request, name, default=None):
+    """Read an optional integer query parameter."""
+    value = request.query.get(name)
+    return int(value) if value not in (None, '') else default
+
+def _trade_filters(request):
+    """Read the ``symbol`` and ``start``/``end`` (epoch seconds) trade filters."""
+    return {
+        'symbol': request.query.get('symbol') or None,
+        'start': _query_float(request, 'start'),
+        'end': _query_float(request, 'end')
+    }
+
+def _trade_page_params(request):
+    """Read trade filters plus the ``cursor`` and ``limit`` paging parameters."""
+    params = _trade_filters(request)
+    params['cursor'] = _query_int(request, 'cursor')
+    params['limit'] = min(_query_int(request, 'limit', 100), 1000)
+    return params
+
+async def get_trades(request):
+    """Get a page of trade history, newest first.
+
+    Supports ``symbol``, ``start``/``end`` (epoch seconds), ``limit`` and the
+    ``cursor`` returned by the previous page.
+    """
+    global bot
+    return _serve_trades(request, bot.blotter)
+
+def _serve_trades(request, blotter):
+    try:
+        page = blotter.page(**_trade_page_params(request))
+        return web.json_response(page)
+    except ValueError as e:
+        return web.json_response({"status": "error", "message": str(e)}, status=400)
+    except Exception as e:
+        logger.error(f"Error getting trades: {str(e)}")
+        return web.json_response({"status": "error", "message": str(e)}, status=500)
+
+async def export_trades(request):
+    """Stream trade history as CSV or Parquet."""
+    global bot
+    return await _serve_export(request, bot.blotter)
+
+async def _serve_export(request, blotter):
+    try:
+        export_format = request.query.get('format', 'csv')
+        filters = _trade_filters(request)
+    except ValueError as e:
+        return web.json_response({"status": "error", "message": str(e)}, status=400)
+
+    if export_format == 'csv':
+        # Copy the rows up front: trades recorded while the response is being
+        # written could otherwise overwrite slots that have not been sent yet
+        columns = blotter.columns(**filters)
+        rows = zip(*(columns[field] for field in BLOTTER_FIELDS))
+        return await _export_trades_csv(request, rows)
+    if export_format == 'parquet':
+        return await _export_trades_parquet(request, blotter.columns(**filters))
+    return _unsupported_format(export_format)
+
+def _trading_pair():
+    """The configured trading pair (read from disk in the multi-process web worker)."""
+    config = bot.config if bot is not None else load_config()
+    return config.get('trading_pair', 'BTC-USDT')
+
+def _history_params(request):
+    """Read price history query parameters, defaulting to the last hour of the trading pair."""
+    end = _query_float(request, 'end')
+    if end is None:
+        end = get_clock().time()
+    start = _query_float(request, 'start')
+    return {
+        'symbol': request.query.get('symbol') or _trading_pair(),
+        'start': start if start is not None else end - 3600,
+        'end': end,
+        'width': min(_query_int(request, 'width', 500), 5000),
+        'since': _query_float(request, 'since'),
+        'method': request.query.get('method', 'lttb')
+    }
+
+async def get_history(request):
+    """Get a downsampled price series for the chart.
+
+    Supports ``symbol``, ``start``/``end`` (epoch seconds), ``width`` (points),
+    ``method`` (``lttb`` or ``minmax``) and ``since`` for incremental updates.
+    """
+    global bot
+    return _serve_history(request, bot.history)
+
+def _serve_history(request, history):
+    try:
+        return web.json_response(history.query(**_history_params(request)))
+    except ValueError as e:
+        return web.json_response({"status": "error", "message": str(e)}, status=400)
+    except Exception as e:
+        logger.error(f"Error getting price history: {str(e)}")
+        return web.json_response({"status": "error", "message": str(e)}, status=500)
+
+def _unsupported_format(export_format):
+    return web.json_response(
+        {"status": "error", "message": f"Unsupported export format: {export_format}"},
+        status=400
+    )
+
+async def _export_trades_csv(request, rows, chunk_rows=1000):
+    """Write trade rows to the response in CSV chunks."""
+    response = web.StreamResponse(headers={
+        'Content-Type': 'text/csv',
+        'Content-Disposition': 'attachment; filename="trades.csv"'
+    })
+    await response.prepare(request)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(BLOTTER_FIELDS)
+    for i, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if i % chunk_rows == 0:
+            await response.write(buffer.getvalue().encode())
+            buffer.seek(0)
+            buffer.truncate()
+    await response.write(buffer.getvalue().encode())
+    await response.write_eof()
+    return response
+
+async def _export_trades_parquet(request, columns):
+    """Send trade columns as a Parquet file (requires pyarrow)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return web.json_response(
+            {"status": "error", "message": "Parquet export requires pyarrow"},
+            status=501
+        )
+
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink)
+    return web.Response(
+        body=sink.getvalue().to_pybytes(),
+        headers={
+            'Content-Type': 'application/vnd.apache.parquet',
+            'Content-Disposition': 'attachment; filename="trades.parquet"'
+        }
+    )
+
+# Multi-process mode: the web process forwards control calls to the strategy
+# process and serves reads from the copies in its DashboardReplica
+def _strategy_unavailable():
+    return web.json_response(
+        {"status": "error", "message": "Strategy process unavailable"},
+        status=503
+    )
+
+async def _call_strategy(request, method, params=None):
+    """Forward a request to the strategy process and return its JSON result."""
+    try:
+        result = await request.app['ipc'].call(method, params)
+        return web.json_response(result)
+    except ConnectionError as e:
+        logger.error(f"Error calling strategy process ({method}): {str(e)}")
+        return _strategy_unavailable()
+    except Exception as e:
+        logger.error(f"Error calling strategy process ({method}): {str(e)}")
+        return web.json_response({"status": "error", "message": str(e)}, status=500)
+
+async def remote_start_bot(request):
+    """Start the trading bot in the strategy process."""
+    return await _call_strategy(request, 'start')
+
+async def remote_stop_bot(request):
+    """Stop the trading bot in the strategy process."""
+    return await _call_strategy(request, 'stop')
+
+async def remote_get_status(request):
+    """Serve the latest status snapshot pushed by the strategy process."""
+    status = request.app['ipc'].status
+    if status is None:
+        return _strategy_unavailable()
+    return web.Response(body=status, content_type='application/json')
+
+async def remote_get_trades(request):
+    """Get a page of trade history from the web process's replica."""
+    replica = request.app['replica']
+    if replica.blotter is None:
+        return _strategy_unavailable()
+    return _serve_trades(request, replica.blotter)
+
+async def remote_export_trades(request):
+    """Export trade history from the web process's replica."""
+    replica = request.app['replica']
+    if replica.blotter is None:
+        return _strategy_unavailable()
+    return await _serve_export(request, replica.blotter)
+
+async def remote_get_history(request):
+    """Get a downsampled price series from the web process's replica."""
+    replica = request.app['replica']
+    if replica.history is None:
+        return _strategy_unavailable()
+    return _serve_history(request, replica.history)
+
+async def remote_update_config(request):
+    """Update the configuration and restart the strategy process's bot."""
+    try:
+        data = await request.json()
+    except ValueError as e:
+        return web.json_response({"status": "error", "message": str(e)}, status=400)
+    return await _call_strategy(request, 'config', {'data': data})
+
+def setup_routes(app, remote=False):
+    """Setup web application routes.
+
+    With ``remote`` control calls are forwarded to the strategy process and
+    reads are served from the web process's replica of its data.
+    """
     app.router.add_get('/', index)
     app.router.add_static('/ui', 'ui')  # Serve UI files
-    app.router.add_post('/api/start', start_bot)
-    app.router.add_post('/api/stop', stop_bot)
-    app.router.add_get('/api/status', get_status)
-    app.router.add_post('/api/config', update_config)
+    app.router.add_post('/api/start', remote_start_bot if remote else start_bot)
+    app.router.add_post('/api/stop', remote_stop_bot if remote else stop_bot)
+    app.router.add_get('/api/status', remote_get_status if remote else get_status)
+    app.router.add_get('/api/trades', remote_get_trades if remote else get_trades)
+    app.router.add_get('/api/trades/export', remote_export_trades if remote else export_trades)
+    app.router.add_get('/api/history', remote_get_history if remote else get_history)
+    app.router.add_post('/api/config', remote_update_config if remote else update_config)
 
     # Add CORS middleware
     app.router.add_options('/{tail:.*}', handle_options_request)
@@ -128,9 +361,59 @@ async def init_app():
     
     return app
 
+async def init_remote_app(socket_path):
+    """Initialize the web application for the multi-process web worker."""
+    app = web.Application(middlewares=[cors_middleware])
+    setup_routes(app, remote=True)
+
+    from backend.multiprocess import DashboardReplica
+
+    replica = DashboardReplica()
+    client = IPCClient(socket_path, subscribe=True, handlers=replica.handlers)
+    app['ipc'] = client
+    app['replica'] = replica
+
+    async def connect(app):
+        await client.start(wait=False)
+
+    async def disconnect(app):
+        await client.close()
+
+    app.on_startup.append(connect)
+    app.on_cleanup.append(disconnect)
+    return app
+
+def run_web_worker(socket_path, host, port):
+    """Entry point of the web process in multi-process mode."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    web.run_app(init_remote_app(socket_path), host=host, port=port)
+
+def run_multiprocess(socket_dir, host='0.0.0.0', port=8000):
+    """Run market data, strategy and web UI as supervised processes."""
+    from backend.multiprocess import Supervisor, run_market_data, run_strategy
+
+    os.makedirs(socket_dir, exist_ok=True)
+    socket_path = os.path.join(socket_dir, 'strategy.sock')
+
+    supervisor = Supervisor()
+    supervisor.add('strategy', run_strategy, socket_path)
+    supervisor.add('market_data', run_market_data, socket_path)
+    supervisor.add('web', run_web_worker, socket_path, host, port)
+    supervisor.run()
+
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description='Autonomous crypto trading bot')
+    parser.add_argument('--multiprocess', action='store_true',
+                        help='run market data, strategy and web UI in separate processes')
+    parser.add_argument('--socket-dir', default=os.path.join(tempfile.gettempdir(), 'trading_bot'),
+                        help='directory for the inter-process Unix sockets')
+    args = parser.parse_args()
+
     try:
+        if args.multiprocess:
+            run_multiprocess(args.socket_dir)
+            return
         app = asyncio.run(init_app())
         web.run_app(app, host='0.0.0.0', port=8000)
     except Exception as e:
@@ -0,0 +1,149 @@
+import csv
+import os
+import tempfile
+
+from backend.blotter import TradeBlotter
+from backend.clock import VirtualClock, set_clock
+from backend.exchange.base import OrderResponse
+
+def _order(order_id, symbol='BTC-USDT', side='buy', status='filled', timestamp=0.0):
+    return OrderResponse(order_id, symbol, side, 0.01, 50000.0 + order_id, status, timestamp)
+
+def _record(blotter, clock, orders):
+    """Record each order one simulated second after the previous one."""
+    for order in orders:
+        clock.advance(1)
+        blotter.record(order)
+
+def _pages(blotter, **filters):
+    """Follow next_cursor to the end and return the seqs seen, newest first."""
+    seqs, cursor = [], None
+    while True:
+        page = blotter.page(cursor=cursor, limit=2, **filters)
+        seqs += [row['seq'] for row in page['trades']]
+        cursor = page['next_cursor']
+        if cursor is None:
+            return seqs
+
+def test_eviction_and_spill():
+    """
+    Rows pushed out of the ring buffer are spilled to CSV and leave the symbol index.
+    """
+    clock = VirtualClock(1000)
+    previous = set_clock(clock)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            spill_path = os.path.join(tmp, 'spill.csv')
+            blotter = TradeBlotter(capacity=3, spill_path=spill_path)
+            _record(blotter, clock, [_order(i, 'ETH-USDT' if i % 2 else 'BTC-USDT') for i in range(5)])
+
+            assert len(blotter) == 3 and blotter.oldest_seq == 2
+            assert blotter.get(1) is None and blotter.get(2)['order_id'] == '2'
+            assert [row['seq'] for row in blotter.iter_rows(symbol='BTC-USDT')] == [2, 4]
+
+            # Spilled rows are on disk before the blotter is closed
+            with open(spill_path, newline='') as f:
+                rows = list(csv.DictReader(f))
+            assert [row['seq'] for row in rows] == ['0', '1']
+            assert [row['symbol'] for row in rows] == ['BTC-USDT', 'ETH-USDT']
+            blotter.close()
+    finally:
+        set_clock(previous)
+
+def test_cursor_paging():
+    """
+    Following next_cursor visits every matching row once, with and without a symbol.
+    """
+    clock = VirtualClock(1000)
+    previous = set_clock(clock)
+    try:
+        blotter = TradeBlotter(capacity=8)
+        _record(blotter, clock, [_order(i, 'ETH-USDT' if i % 3 == 0 else 'BTC-USDT') for i in range(11)])
+
+        assert _pages(blotter) == list(range(10, 2, -1))
+        assert _pages(blotter, symbol='BTC-USDT') == [10, 8, 7, 5, 4]
+        assert _pages(blotter, symbol='ETH-USDT') == [9, 6, 3]
+        assert _pages(blotter, symbol='XRP-USDT') == []
+    finally:
+        set_clock(previous)
+
+def test_time_filters_use_record_time():
+    """
+    Out-of-order exchange timestamps do not affect start/end filtering.
+    """
+    clock = VirtualClock(0)
+    previous = set_clock(clock)
+    try:
+        blotter = TradeBlotter(capacity=8)
+        _record(blotter, clock, [_order(i, timestamp=t) for i, t in enumerate([5.0, 3.0, 9.0, 1.0])])
+
+        trades = blotter.page(start=2, end=3)['trades']
+        assert [row['seq'] for row in trades] == [2, 1]
+        assert [row['exchange_time'] for row in trades] == [9.0, 3.0]
+    finally:
+        set_clock(previous)
+
+def test_rejected_rows():
+    """
+    An order with an unknown side or status is rejected without touching the buffer.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        spill_path = os.path.join(tmp, 'spill.csv')
+        blotter = TradeBlotter(capacity=2, spill_path=spill_path)
+        blotter.record(_order(0))
+        blotter.record(_order(1))
+
+        for bad in (_order(2, side='hold'), _order(2, status='closed')):
+            try:
+                blotter.record(bad)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"Recorded invalid order {bad}")
+
+        assert blotter.next_seq == 2 and not os.path.exists(spill_path)
+        assert [row['seq'] for row in blotter.iter_rows(symbol='BTC-USDT')] == [0, 1]
+
+        blotter.record(_order(2))
+        assert [row['seq'] for row in blotter.iter_rows(symbol='BTC-USDT')] == [1, 2]
+        blotter.close()
+        with open(spill_path, newline='') as f:
+            assert [row['seq'] for row in csv.DictReader(f)] == ['0']
+
+def test_append_copy():
+    """
+    A copy built with append() keeps seqs and evicts from the copied seq onwards.
+    """
+    clock = VirtualClock(1000)
+    previous = set_clock(clock)
+    try:
+        source = TradeBlotter(capacity=4)
+        _record(source, clock, [_order(i) for i in range(6)])
+
+        copy = TradeBlotter(capacity=4)
+        for row in source.iter_rows():
+            copy.append(row)
+        assert (copy.oldest_seq, copy.next_seq) == (2, 6)
+
+        _record(source, clock, [_order(6)])
+        copy.append(source.get(6))
+        assert list(copy.iter_rows()) == list(source.iter_rows())
+        assert copy.page(cursor=5, limit=2) == source.page(cursor=5, limit=2)
+
+        try:
+            copy.append(source.get(6))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Appended a row out of order")
+    finally:
+        set_clock(previous)
+
+if __name__ == "__main__":
+    print("Starting trade blotter test...")
+    test_eviction_and_spill()
+    test_cursor_paging()
+    test_time_filters_use_record_time()
+    test_rejected_rows()
+    test_append_copy()
+    print("Test completed successfully!")
@@ -1,9 +1,11 @@
+import argparse
 import asyncio
 import json
 from backend.trading_bot import TradingBot
+from backend.clock import run_virtual
 from backend.logger import logger
 
-async def test_paper_trading():
+async def test_paper_trading(seconds=10):
     """
     Test basic paper trading functionality.
     """
@@ -21,7 +23,7 @@ async def test_paper_trading():
         
         # Wait for a few cycles
         logger.info("Waiting for trading cycles...")
-        await asyncio.sleep(10)
+        await asyncio.sleep(seconds)
         
         # Get updated status
         status = await bot.get_status()
@@ -38,10 +40,20 @@ async def test_paper_trading():
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Paper trading smoke test')
+    parser.add_argument('--seconds', type=float, default=10,
+                        help='trading time to simulate (default: 10)')
+    parser.add_argument('--realtime', action='store_true',
+                        help='wait in wall-clock time instead of virtual time')
+    args = parser.parse_args()
+    
     print("Starting paper trading test...")
     
-    # Run the test
-    success = asyncio.run(test_paper_trading())
+    # Run the test; in virtual time the bot's timers fire without waiting
+    if args.realtime:
+        success = asyncio.run(test_paper_trading(args.seconds))
+    else:
+        success = run_virtual(test_paper_trading(args.seconds))
     
     if success:
         print("Test completed successfully!")
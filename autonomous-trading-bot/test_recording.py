@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+from backend.exchange.recording import (
+    KIND_HTTP, KIND_TICK, CaptureRecord, CaptureWriter, read_capture, read_ticks
+)
+
+def _http(path, response, status=200):
+    return CaptureRecord(KIND_HTTP, 1000.0, 0.25, status, 'GET', path, b'', response)
+
+def test_round_trip():
+    """
+    Mixed HTTP and tick records read back in order, across reopened writers.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'session.bin')
+
+        writer = CaptureWriter(path)
+        writer.write(_http('/v2/time', b'{}'))
+        writer.write_tick('BTC-USDT', 1000.5, 50000.25)
+        writer.close()
+
+        # Appending to an existing capture does not add a second header
+        reopened = CaptureWriter(path)
+        reopened.write(CaptureRecord(KIND_HTTP, 1001.0, 0.5, 0, 'POST', '/v2/orders',
+                                     b'{"size":1}', b'Connection reset'))
+        reopened.write_tick('ETH-USDT', 1001.5, 3000.0)
+        reopened.close()
+
+        records = list(read_capture(path))
+        assert [r.kind for r in records] == [KIND_HTTP, KIND_TICK, KIND_HTTP, KIND_TICK]
+        assert records[0] == _http('/v2/time', b'{}')
+        assert (records[2].method, records[2].path, records[2].status) == ('POST', '/v2/orders', 0)
+        assert (records[2].request, records[2].response) == (b'{"size":1}', b'Connection reset')
+        assert list(read_ticks(path)) == [('BTC-USDT', 1000.5, 50000.25), ('ETH-USDT', 1001.5, 3000.0)]
+
+def test_truncated_record():
+    """
+    A record cut short by a crash ends the capture without losing earlier ones.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'session.bin')
+        writer = CaptureWriter(path)
+        writer.write_tick('BTC-USDT', 1000.0, 50000.0)
+        writer.write(_http('/v2/tickers/BTC-USDT', b'{"mark_price":"50001"}'))
+        writer.close()
+
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 5)
+        assert list(read_ticks(path)) == [('BTC-USDT', 1000.0, 50000.0)]
+        assert len(list(read_capture(path))) == 1
+
+if __name__ == "__main__":
+    print("Starting capture file test...")
+    test_round_trip()
+    test_truncated_record()
+    print("Test completed successfully!")
@@ -1,15 +1,18 @@
 // Global variables
 let priceChart = null;
-let priceData = [];
-const maxDataPoints = 100;
+let priceTimes = [];
+let lastHistoryTime = null;
+const historyWindowSeconds = 3600;
 
 // Initialize the dashboard
 document.addEventListener('DOMContentLoaded', () => {
     initializeChart();
     setupEventListeners();
     updateStatus();
-    // Poll status every second
+    loadHistory();
+    // Poll status and new chart points every second
     setInterval(updateStatus, 1000);
+    setInterval(updateHistory, 1000);
 });
 
 // Initialize price chart
@@ -47,21 +50,74 @@ function setupEventListeners() {
     document.getElementById('stopButton').addEventListener('click', stopBot);
 }
 
-// Update chart with new price data
-function updateChart(price) {
-    const now = new Date();
-    const timeStr = now.toLocaleTimeString();
-    
-    priceChart.data.labels.push(timeStr);
-    priceChart.data.datasets[0].data.push(price);
-    
-    // Keep only last N data points
-    if (priceChart.data.labels.length > maxDataPoints) {
-        priceChart.data.labels.shift();
-        priceChart.data.datasets[0].data.shift();
+// Number of points the chart can usefully draw
+function chartWidth() {
+    return Math.max(100, document.getElementById('priceChart').clientWidth);
+}
+
+// Load a downsampled window of price history into the chart
+async function loadHistory() {
+    try {
+        const start = Date.now() / 1000 - historyWindowSeconds;
+        const response = await fetch(`/api/history?start=${start}&width=${chartWidth()}`);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        const data = await response.json();
+        
+        priceTimes = [];
+        priceChart.data.labels = [];
+        priceChart.data.datasets[0].data = [];
+        appendPoints(data.points);
+        lastHistoryTime = data.last;
+        priceChart.update('none'); // Update without animation
+        
+    } catch (error) {
+        console.error('Error loading price history:', error);
+    }
+}
+
+// Fetch only the points added since the last update
+async function updateHistory() {
+    if (lastHistoryTime === null) {
+        return loadHistory();
     }
     
-    priceChart.update('none'); // Update without animation
+    try {
+        const response = await fetch(`/api/history?since=${lastHistoryTime}&width=${chartWidth()}`);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        const data = await response.json();
+        appendPoints(data.points);
+        lastHistoryTime = data.last;
+        
+        // Drop points that have scrolled out of the window
+        const cutoff = Date.now() / 1000 - historyWindowSeconds;
+        while (priceTimes.length > 0 && priceTimes[0] < cutoff) {
+            priceTimes.shift();
+            priceChart.data.labels.shift();
+            priceChart.data.datasets[0].data.shift();
+        }
+        
+        // Re-downsample once incremental points outgrow the chart
+        if (priceTimes.length > 2 * chartWidth()) {
+            return loadHistory();
+        }
+        priceChart.update('none'); // Update without animation
+        
+    } catch (error) {
+        console.error('Error updating price history:', error);
+    }
+}
+
+// Append [timestamp, price] points to the chart
+function appendPoints(points) {
+    for (const [time, price] of points) {
+        priceTimes.push(time);
+        priceChart.data.labels.push(new Date(time * 1000).toLocaleTimeString());
+        priceChart.data.datasets[0].data.push(price);
+    }
 }
 
 // Update dashboard status
@@ -93,10 +149,9 @@ async function updateStatus() {
         pnlElement.textContent = formatCurrency(pnl);
         pnlElement.className = `text-2xl font-semibold ${pnl >= 0 ? 'text-green-600' : 'text-red-600'}`;
         
-        // Update price chart if we have positions
-        if (data.positions.length > 0) {
-            const lastPosition = data.positions[0];
-            updateChart(lastPosition.current_price);
+        // Update performance analytics
+        if (data.analytics) {
+            updateAnalytics(data.analytics);
         }
         
     } catch (error) {
@@ -104,6 +159,21 @@ async function updateStatus() {
     }
 }
 
+// Update performance analytics cards
+function updateAnalytics(analytics) {
+    const realizedElement = document.getElementById('realizedPnl');
+    realizedElement.textContent = formatCurrency(analytics.realized_pnl);
+    realizedElement.className = `text-2xl font-semibold ${analytics.realized_pnl >= 0 ? 'text-green-600' : 'text-red-600'}`;
+    
+    document.getElementById('fees').textContent = formatCurrency(analytics.fees);
+    document.getElementById('maxDrawdown').textContent = `${analytics.max_drawdown.toFixed(2)}%`;
+    document.getElementById('sharpe').textContent = formatRatio(analytics.sharpe);
+    document.getElementById('sortino').textContent = formatRatio(analytics.sortino);
+    document.getElementById('winRate').textContent = analytics.win_rate === null
+        ? '-'
+        : `${analytics.win_rate.toFixed(1)}%`;
+}
+
 // Start the trading bot
 async function startBot() {
     try {
@@ -163,3 +233,8 @@ function formatCurrency(value) {
         currency: 'USD'
     }).format(value);
 }
+
+// Format optional ratio values
+function formatRatio(value) {
+    return value === null || value === undefined ? '-' : value.toFixed(2);
+}